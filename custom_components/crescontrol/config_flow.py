@@ -7,22 +7,24 @@ and performs basic connectivity testing.
 
 from __future__ import annotations
 
-import asyncio
 import logging
+import re
 from typing import Any, Dict
 
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from aiohttp import ClientTimeout, ClientError
 
 from .simple_http_client import SimpleCresControlHTTPClient
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Host validation patterns
+_IP_PATTERN = re.compile(r'^(\d{1,3}\.){3}\d{1,3}$')
+_HOSTNAME_PATTERN = re.compile(r'^[a-zA-Z0-9.-]+$')
+
 
 class CresControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for CresControl."""
@@ -71,13 +73,10 @@ class CresControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def _is_valid_host(self, host: str) -> bool:
         """Validate host format (basic IP address or hostname check)."""
-        import re
-        
         # Simplified validation - just check for basic format
         
         # Check for basic IP address format
-        ip_pattern = re.compile(r'^(\d{1,3}\.){3}\d{1,3}$')
-        if ip_pattern.match(host):
+        if _IP_PATTERN.match(host):
             # Basic IP validation
             parts = host.split('.')
             try:
@@ -86,8 +85,7 @@ class CresControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return False
         
         # Check for basic hostname format (letters, numbers, dots, hyphens)
-        hostname_pattern = re.compile(r'^[a-zA-Z0-9.-]+$')
-        return hostname_pattern.match(host) is not None and len(host) <= 253
+        return _HOSTNAME_PATTERN.match(host) is not None and len(host) <= 253
 
     async def _validate_connection(self, host: str) -> None:
         """Validate connection to CresControl device using simple connectivity test."""
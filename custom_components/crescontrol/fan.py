@@ -23,6 +23,9 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Device string values that mean the fan is enabled
+_TRUTHY_STATES = frozenset(("true", "1", "on", "enabled"))
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -77,7 +80,7 @@ class CresControlFan(CoordinatorEntity, FanEntity):
             if isinstance(enabled, bool):
                 return enabled
             elif isinstance(enabled, str):
-                return enabled.lower() in ("true", "1", "on", "enabled")
+                return enabled.lower() in _TRUTHY_STATES
             elif isinstance(enabled, (int, float)):
                 return bool(enabled)
         except (TypeError, ValueError):
@@ -113,23 +116,35 @@ class CresControlFan(CoordinatorEntity, FanEntity):
         if percentage is None:
             percentage = 50  # Default to 50% speed
             
+        values: Dict[str, Any] = {"fan:enabled": True}
+        if percentage > 0:
+            values["fan:duty-cycle"] = percentage
+            
         try:
-            await self._client.set_value("fan:enabled", True)
-            if percentage > 0:
-                await self._client.set_value("fan:duty-cycle", percentage)
-            await self.coordinator.async_request_refresh()
+            success = await self._client.set_multiple_values(values)
         except Exception as err:
             _LOGGER.error("Failed to turn on fan: %s", err)
             raise HomeAssistantError("Failed to turn on fan") from err
+        
+        if not success:
+            _LOGGER.error("Device did not confirm fan turn on")
+            raise HomeAssistantError("Failed to turn on fan")
+        
+        await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the fan."""
         try:
-            await self._client.set_value("fan:enabled", False)
-            await self.coordinator.async_request_refresh()
+            success = await self._client.set_value("fan:enabled", False)
         except Exception as err:
             _LOGGER.error("Failed to turn off fan: %s", err)
             raise HomeAssistantError("Failed to turn off fan") from err
+        
+        if not success:
+            _LOGGER.error("Device did not confirm fan turn off")
+            raise HomeAssistantError("Failed to turn off fan")
+        
+        await self.coordinator.async_request_refresh()
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the speed percentage of the fan."""
@@ -138,11 +153,17 @@ class CresControlFan(CoordinatorEntity, FanEntity):
             
         try:
             if percentage == 0:
-                await self._client.set_value("fan:enabled", False)
+                success = await self._client.set_value("fan:enabled", False)
             else:
-                await self._client.set_value("fan:enabled", True)
-                await self._client.set_value("fan:duty-cycle", percentage)
-            await self.coordinator.async_request_refresh()
+                success = await self._client.set_multiple_values(
+                    {"fan:enabled": True, "fan:duty-cycle": percentage}
+                )
         except Exception as err:
             _LOGGER.error("Failed to set fan percentage: %s", err)
-            raise HomeAssistantError("Failed to set fan percentage") from err
\ No newline at end of file
+            raise HomeAssistantError("Failed to set fan percentage") from err
+        
+        if not success:
+            _LOGGER.error("Device did not confirm fan percentage %s", percentage)
+            raise HomeAssistantError("Failed to set fan percentage")
+        
+        await self.coordinator.async_request_refresh()
\ No newline at end of file
@@ -13,7 +13,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
@@ -30,6 +30,33 @@ class CresControlError(Exception):
 
 _LOGGER = logging.getLogger(__name__)
 
+# Core parameters polled over the fallback path that are confirmed to work
+POLL_PARAMETERS = (
+    'in-a:voltage',      # Analog inputs
+    'in-b:voltage',      # Second analog input
+    'fan:enabled',       # Fan control
+    'fan:duty-cycle',    # Fan speed
+    'fan:rpm',           # Fan RPM
+    'out-a:enabled',     # Output states
+    'out-a:voltage',     # Output voltages
+    'out-b:enabled',
+    'out-b:voltage',
+    'out-c:enabled',
+    'out-c:voltage',
+    'out-d:enabled',
+    'out-d:voltage',
+    'out-e:enabled',
+    'out-e:voltage',
+    'out-f:enabled',
+    'out-f:voltage',
+    # Extension sensor parameters
+    'extension:climate-2011:temperature',
+    'extension:climate-2011:humidity',
+    'extension:climate-2011:vpd',
+    'extension:co2-2006:co2-concentration',
+    'extension:co2-2006:temperature',
+)
+
 
 class CresControlHybridCoordinator(DataUpdateCoordinator):
     """Hybrid coordinator using WebSocket data with HTTP fallback."""
@@ -79,16 +106,23 @@ class CresControlHybridCoordinator(DataUpdateCoordinator):
         self._http_last_data_time: Optional[datetime] = None
         self._http_data: Dict[str, Any] = {}
         
+        # Values written by us and not yet reported back by the device, with
+        # the write sequence number each was confirmed at
+        self._written_data: Dict[str, str] = {}
+        self._written_at: Dict[str, int] = {}
+        self._write_count = 0
+        
         # Setup WebSocket data handler
-        self.websocket_client.add_data_handler(self._handle_websocket_data)
+        self.websocket_client.add_batch_data_handler(self._handle_websocket_data)
         
         _LOGGER.info("Hybrid coordinator initialized for %s", host)
     
     def _handle_websocket_data(self, data: Dict[str, str]) -> None:
         """Handle incoming WebSocket data updates.
         
-        This method is called by the WebSocket client when new data arrives.
-        It updates the coordinator's data and notifies all listeners.
+        This method is called by the WebSocket client with the updates that
+        arrived during one batch window. It updates the coordinator's data
+        and notifies all listeners.
         
         Parameters
         ----------
@@ -104,8 +138,12 @@ class CresControlHybridCoordinator(DataUpdateCoordinator):
         self._websocket_connected = True
         self._websocket_last_data_time = dt_util.utcnow()
         
-        # Merge new data with existing WebSocket data
+        # Merge new data with existing WebSocket data; device reports
+        # supersede values we wrote ourselves
         self._websocket_data.update(data)
+        for parameter in data:
+            self._written_data.pop(parameter, None)
+            self._written_at.pop(parameter, None)
         
         # Create combined data from WebSocket and HTTP sources
         combined_data = self._get_combined_data()
@@ -118,7 +156,8 @@ class CresControlHybridCoordinator(DataUpdateCoordinator):
     def _get_combined_data(self) -> Dict[str, Any]:
         """Get combined data from WebSocket and HTTP sources.
         
-        WebSocket data takes priority over HTTP data when available.
+        WebSocket data takes priority over HTTP data when available, and
+        values written since the last device report take priority over both.
         
         Returns
         -------
@@ -131,6 +170,9 @@ class CresControlHybridCoordinator(DataUpdateCoordinator):
         # Overlay WebSocket data (takes priority)
         combined_data.update(self._websocket_data)
         
+        # Overlay confirmed writes until the device reports them
+        combined_data.update(self._written_data)
+        
         return combined_data
     
     def _should_use_websocket_data(self) -> bool:
@@ -222,39 +264,23 @@ class CresControlHybridCoordinator(DataUpdateCoordinator):
             else:
                 _LOGGER.debug("WebSocket unavailable, performing HTTP data fetch for %s", self.host)
             
-            # Core parameters that are confirmed to work
-            commands = [
-                'in-a:voltage',      # Analog inputs
-                'in-b:voltage',      # Second analog input
-                'fan:enabled',       # Fan control
-                'fan:duty-cycle',    # Fan speed
-                'fan:rpm',           # Fan RPM
-                'out-a:enabled',     # Output states
-                'out-a:voltage',     # Output voltages
-                'out-b:enabled',
-                'out-b:voltage',
-                'out-c:enabled',
-                'out-c:voltage',
-                'out-d:enabled',
-                'out-d:voltage',
-                'out-e:enabled',
-                'out-e:voltage',
-                'out-f:enabled',
-                'out-f:voltage',
-                # Extension sensor parameters
-                'extension:climate-2011:temperature',
-                'extension:climate-2011:humidity',
-                'extension:climate-2011:vpd',
-                'extension:co2-2006:co2-concentration',
-                'extension:co2-2006:temperature',
-            ]
+            # Writes confirmed after this point may not be reflected by the poll
+            writes_before_poll = self._write_count
             
             # Use get_multiple_values method from SimpleCresControlHTTPClient
-            http_data = await self.http_client.get_multiple_values(commands)
+            http_data = await self.http_client.get_multiple_values(POLL_PARAMETERS)
             
             # Update HTTP state
             self._http_last_data_time = dt_util.utcnow()
-            self._http_data = http_data
+            # Keep the last known value of parameters this poll missed
+            self._http_data.update(http_data)
+            
+            # Polled values supersede writes confirmed before the poll began
+            for parameter in http_data:
+                written_at = self._written_at.get(parameter)
+                if written_at is not None and written_at <= writes_before_poll:
+                    del self._written_data[parameter]
+                    del self._written_at[parameter]
             
             _LOGGER.debug("HTTP data fetch successful for %s: %d parameters", self.host, len(http_data))
             
@@ -309,18 +335,48 @@ class CresControlHybridCoordinator(DataUpdateCoordinator):
             Parameter name to set.
         value: Any
             Value to set.
+            
+        Raises
+        ------
+        UpdateFailed
+            If the device did not confirm the write.
         """
         try:
             _LOGGER.debug("Setting %s = %s via HTTP", parameter, value)
-            await self.http_client.set_value(parameter, value)
-            
-            # Trigger immediate refresh to get updated state
-            await self.async_request_refresh()
-            
+            success = await self.http_client.set_value(parameter, value)
         except Exception as err:
             error_msg = f"Failed to set {parameter} = {value}: {err}"
             _LOGGER.error(error_msg)
             raise UpdateFailed(error_msg) from err
+        
+        if not success:
+            error_msg = f"Failed to set {parameter} = {value}: no response from device"
+            _LOGGER.error(error_msg)
+            raise UpdateFailed(error_msg)
+        
+        # The device accepted the write, so publish it without a full refresh
+        self.async_apply_written_values({parameter: value})
+    
+    @callback
+    def async_apply_written_values(self, values: Dict[str, Any]) -> None:
+        """Publish values that were just written to the device.
+        
+        The written values are kept in their own layer on top of the
+        WebSocket and HTTP data, so entities reflect the new state immediately
+        instead of waiting for a refresh of every parameter. A WebSocket
+        report for a parameter, or an HTTP poll that started after the
+        write and returned the parameter, replaces them.
+        
+        Parameters
+        ----------
+        values: Dict[str, Any]
+            Parameter values acknowledged by the device.
+        """
+        self._write_count += 1
+        for parameter, value in values.items():
+            self._written_data[parameter] = str(value)
+            self._written_at[parameter] = self._write_count
+        self.async_set_updated_data(self._get_combined_data())
     
     async def async_get_value(self, parameter: str) -> Any:
         """Get a parameter value, preferring WebSocket data.
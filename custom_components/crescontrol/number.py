@@ -7,7 +7,7 @@ Simplified number implementation for voltage control.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict
 
 from homeassistant.components.number import NumberEntity
 from homeassistant.const import UnitOfElectricPotential
@@ -125,15 +125,9 @@ class CresControlNumber(CoordinatorEntity, NumberEntity):
         if raw_value is None:
             return None
             
-        # Simple value parsing
+        # float() accepts numbers and surrounding whitespace in strings
         try:
-            if isinstance(raw_value, (int, float)):
-                return float(raw_value)
-            elif isinstance(raw_value, str):
-                raw_value = raw_value.strip()
-                if not raw_value:
-                    return None
-                return float(raw_value)
+            return float(raw_value)
         except (ValueError, TypeError):
             _LOGGER.debug("Failed to parse number value for %s: %s", self._key, raw_value)
             
@@ -142,15 +136,18 @@ class CresControlNumber(CoordinatorEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Set a new voltage value on the CresControl."""
         # Clamp value within allowed range
-        if value < self._attr_native_min_value:
-            value = self._attr_native_min_value
-        elif value > self._attr_native_max_value:
-            value = self._attr_native_max_value
+        value = max(self._attr_native_min_value, min(value, self._attr_native_max_value))
         
         try:
-            await self._client.set_value(self._key, value)
-            await self.coordinator.async_request_refresh()
+            success = await self._client.set_value(self._key, value)
         except Exception as err:
             _LOGGER.error("Failed to set value for %s: %s", self._attr_name, err)
             raise HomeAssistantError(f"Failed to set {self._attr_name}") from err
+        
+        if not success:
+            _LOGGER.error("Device did not confirm value for %s", self._attr_name)
+            raise HomeAssistantError(f"Failed to set {self._attr_name}")
+        
+        # Publish the written value instead of refreshing every parameter
+        self.coordinator.async_apply_written_values({self._key: value})
 
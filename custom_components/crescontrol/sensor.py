@@ -6,8 +6,10 @@ Simplified sensor implementation focusing on core parameters only.
 
 from __future__ import annotations
 
+import functools
 import logging
-from typing import Any, Dict, List
+import re
+from typing import Any, Callable, Dict
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -26,10 +28,17 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.config_entries import ConfigEntry
 
 from .const import DOMAIN
+from .websocket_client import is_error_response
 
 
 _LOGGER = logging.getLogger(__name__)
 
+# RS485 response format: [address:param=value;param=value;...:checksum]
+_RS485_RESPONSE_PATTERN = re.compile(r'\[(\d+):(.*?):(\d+)\]')
+
+# Plain-text values the device reports instead of a reading
+_ERROR_INDICATORS = frozenset(("error", "n/a", "unavailable", "unknown"))
+
 
 # Core sensor definitions - including CO2 and climate sensors
 CORE_SENSORS = [
@@ -139,6 +148,172 @@ CORE_SENSORS = [
 ]
 
 
+def _parse_rs485_response(response_str: str) -> dict:
+    """Parse RS485 response string to extract sensor parameters.
+    
+    Format: "[address:param=value;param=value;...:checksum]"
+    Example: "[5:100=25.93;101=57.72;102=.;103=0:133]"
+    
+    Args:
+        response_str: Raw RS485 response string
+        
+    Returns:
+        Dict mapping parameter IDs to values, or empty dict if parsing fails
+    """
+    if not isinstance(response_str, str):
+        return {}
+    
+    # Remove quotes if present
+    if response_str.startswith('"') and response_str.endswith('"'):
+        response_str = response_str[1:-1]
+    
+    match = _RS485_RESPONSE_PATTERN.match(response_str)
+    
+    if not match:
+        return {}
+    
+    params_str = match.group(2)
+    params = {}
+    
+    # Parse parameters: param=value;param=value
+    for param_pair in params_str.split(';'):
+        if '=' in param_pair:
+            param_id_str, value_str = param_pair.split('=', 1)
+            
+            try:
+                param_id = int(param_id_str)
+                
+                # Handle different value types
+                if value_str == '.':
+                    value = None
+                else:
+                    try:
+                        # Try to convert to float
+                        value = float(value_str)
+                    except ValueError:
+                        # Keep as string if not numeric
+                        value = value_str
+                
+                params[param_id] = value
+                
+            except ValueError:
+                # Skip invalid parameter IDs
+                continue
+    
+    return params
+
+
+def _bounded_float(value: Any, minimum: float, maximum: float) -> float | None:
+    """Return a numeric or numeric string value as float if within bounds."""
+    if isinstance(value, (int, float)):
+        if minimum <= value <= maximum:
+            return float(value)
+    elif isinstance(value, str):
+        try:
+            parsed = float(value)
+        except ValueError:
+            return None
+        if minimum <= parsed <= maximum:
+            return parsed
+    return None
+
+
+def _validate_voltage(key: str, value: Any) -> Any:
+    """Validate an analog input voltage (-15 V to +15 V)."""
+    if isinstance(value, (int, float)):
+        if -15.0 <= value <= 15.0:
+            return round(float(value), 2)  # Round to 2 decimal places
+        _LOGGER.warning("Voltage value %s out of range for %s", value, key)
+        return None
+    return value
+
+
+def _validate_fan_rpm(key: str, value: Any) -> Any:
+    """Validate a fan speed (0 to 10000 RPM)."""
+    if isinstance(value, (int, float)):
+        if 0 <= value <= 10000:
+            return int(value)  # RPM should be integer
+        _LOGGER.warning("RPM value %s out of range for %s", value, key)
+        return None
+    return value
+
+
+def _validate_rs485_value(key: str, value: Any) -> Any:
+    """Extract and validate one parameter from an RS485 response."""
+    # Extract parameter ID from key (e.g., "rs485:response:100" -> 100)
+    param_id = key.split(":")[-1]
+    
+    parsed_data = _parse_rs485_response(value)
+    if parsed_data and param_id.isdigit():
+        param_value = parsed_data.get(int(param_id))
+        
+        if param_value is None:
+            return None
+        
+        # Validate based on parameter type
+        if param_id == "100":  # Temperature
+            if isinstance(param_value, (int, float)) and -40.0 <= param_value <= 80.0:
+                return round(float(param_value), 1)
+        elif param_id == "101":  # Humidity
+            if isinstance(param_value, (int, float)) and 0.0 <= param_value <= 100.0:
+                return round(float(param_value), 1)
+        elif param_id == "103":  # CO2
+            if isinstance(param_value, (int, float)) and 0 <= param_value <= 10000:
+                return int(param_value)
+    
+    return None
+
+
+def _validate_co2_concentration(key: str, value: Any) -> Any:
+    """Validate a CO2 concentration (0 to 10000 ppm)."""
+    co2_value = _bounded_float(value, 0, 10000)
+    if co2_value is not None:
+        return int(co2_value)
+    _LOGGER.debug("Could not parse CO2 concentration value: %s", value)
+    return None
+
+
+def _validate_temperature(key: str, value: Any) -> Any:
+    """Validate an extension temperature (-40 °C to +80 °C)."""
+    temp_value = _bounded_float(value, -40.0, 80.0)
+    if temp_value is not None:
+        return round(temp_value, 1)
+    _LOGGER.debug("Could not parse temperature value: %s", value)
+    return None
+
+
+def _validate_humidity(key: str, value: Any) -> Any:
+    """Validate a relative humidity (0 % to 100 %)."""
+    hum_value = _bounded_float(value, 0.0, 100.0)
+    if hum_value is not None:
+        return round(hum_value, 1)
+    _LOGGER.debug("Could not parse humidity value: %s", value)
+    return None
+
+
+def _validate_vpd(key: str, value: Any) -> Any:
+    """Validate a vapor pressure deficit (0 to 10 kPa)."""
+    vpd_value = _bounded_float(value, 0.0, 10.0)
+    if vpd_value is not None:
+        return round(vpd_value, 2)
+    _LOGGER.debug("Could not parse VPD value: %s", value)
+    return None
+
+
+# Value validators keyed by sensor parameter; keys without an entry are
+# passed through unchanged (RS485 responses are matched by prefix)
+_VALIDATORS: Dict[str, Callable[[str, Any], Any]] = {
+    "in-a:voltage": _validate_voltage,
+    "in-b:voltage": _validate_voltage,
+    "fan:rpm": _validate_fan_rpm,
+    "extension:co2-2006:co2-concentration": _validate_co2_concentration,
+    "extension:co2-2006:temperature": _validate_temperature,
+    "extension:climate-2011:temperature": _validate_temperature,
+    "extension:climate-2011:humidity": _validate_humidity,
+    "extension:climate-2011:vpd": _validate_vpd,
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -170,6 +345,12 @@ class CresControlSensor(CoordinatorEntity, SensorEntity):
         self._attr_device_class = definition.get("device_class")
         self._attr_state_class = definition.get("state_class")
         self._attr_icon = definition.get("icon")
+        # Value handling is fixed per key, so resolve it once here
+        self._validator: Callable[[str, Any], Any] | None = _VALIDATORS.get(self._key)
+        if self._validator is None and self._key.startswith("rs485:response:"):
+            self._validator = _validate_rs485_value
+        # For fan RPM, report 0 when the fan is not connected/responding
+        self._error_value = 0 if self._key == "fan:rpm" else None
 
     @property
     def device_info(self) -> Dict[str, Any]:
@@ -227,15 +408,12 @@ class CresControlSensor(CoordinatorEntity, SensorEntity):
                     return None
                 
                 # Handle JSON error responses gracefully (especially for fan:rpm)
-                if raw_value.startswith('{"error"'):
+                if is_error_response(raw_value):
                     _LOGGER.debug("Received error response for %s: %s", self._key, raw_value)
-                    # For fan RPM, return 0 when fan is not connected/responding
-                    if self._key == "fan:rpm":
-                        return 0
-                    return None
+                    return self._error_value
                 
                 # Handle other error indicators
-                if raw_value.lower() in ['error', 'n/a', 'unavailable', 'unknown']:
+                if raw_value.lower() in _ERROR_INDICATORS:
                     _LOGGER.debug("Received error indicator for %s: %s", self._key, raw_value)
                     return None
                 
@@ -258,9 +436,13 @@ class CresControlSensor(CoordinatorEntity, SensorEntity):
                           self._key, raw_value, err)
             return None
     
-    def _parse_numeric_value(self, value_str: str) -> Any:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_numeric_value(value_str: str) -> Any:
         """Parse a string value to numeric type with proper handling.
         
+        Results are cached since the device repeats a small set of values.
+        
         Args:
             value_str: String value to parse
             
@@ -281,64 +463,6 @@ class CresControlSensor(CoordinatorEntity, SensorEntity):
         except (ValueError, TypeError):
             return None
     
-    def _parse_rs485_response(self, response_str: str) -> dict:
-        """Parse RS485 response string to extract sensor parameters.
-        
-        Format: "[address:param=value;param=value;...:checksum]"
-        Example: "[5:100=25.93;101=57.72;102=.;103=0:133]"
-        
-        Args:
-            response_str: Raw RS485 response string
-            
-        Returns:
-            Dict mapping parameter IDs to values, or empty dict if parsing fails
-        """
-        import re
-        
-        if not isinstance(response_str, str):
-            return {}
-        
-        # Remove quotes if present
-        if response_str.startswith('"') and response_str.endswith('"'):
-            response_str = response_str[1:-1]
-        
-        # Pattern: [address:param=value;param=value;...:checksum]
-        pattern = r'\[(\d+):(.*?):(\d+)\]'
-        match = re.match(pattern, response_str)
-        
-        if not match:
-            return {}
-        
-        params_str = match.group(2)
-        params = {}
-        
-        # Parse parameters: param=value;param=value
-        for param_pair in params_str.split(';'):
-            if '=' in param_pair:
-                param_id_str, value_str = param_pair.split('=', 1)
-                
-                try:
-                    param_id = int(param_id_str)
-                    
-                    # Handle different value types
-                    if value_str == '.':
-                        value = None
-                    else:
-                        try:
-                            # Try to convert to float
-                            value = float(value_str)
-                        except ValueError:
-                            # Keep as string if not numeric
-                            value = value_str
-                    
-                    params[param_id] = value
-                    
-                except ValueError:
-                    # Skip invalid parameter IDs
-                    continue
-        
-        return params
-
     def _validate_sensor_value(self, value: Any) -> Any:
         """Validate sensor value based on sensor type and apply reasonable bounds.
         
@@ -351,120 +475,12 @@ class CresControlSensor(CoordinatorEntity, SensorEntity):
         if value is None:
             return None
         
-        try:
-            # Voltage sensors validation
-            if self._key in ["in-a:voltage", "in-b:voltage"]:
-                if isinstance(value, (int, float)):
-                    # Reasonable voltage range: -15V to +15V
-                    if -15.0 <= value <= 15.0:
-                        return round(float(value), 2)  # Round to 2 decimal places
-                    else:
-                        _LOGGER.warning("Voltage value %s out of range for %s", value, self._key)
-                        return None
-            
-            # Fan RPM validation
-            elif self._key == "fan:rpm":
-                if isinstance(value, (int, float)):
-                    # Reasonable RPM range: 0 to 10000 RPM
-                    if 0 <= value <= 10000:
-                        return int(value)  # RPM should be integer
-                    else:
-                        _LOGGER.warning("RPM value %s out of range for %s", value, self._key)
-                        return None
-            
-            # RS485 sensor data validation
-            elif self._key.startswith("rs485:response:"):
-                # Extract parameter ID from key (e.g., "rs485:response:100" -> 100)
-                param_id = self._key.split(":")[-1]
-                
-                # Parse RS485 response data
-                parsed_data = self._parse_rs485_response(value)
-                if parsed_data and param_id.isdigit():
-                    param_value = parsed_data.get(int(param_id))
-                    
-                    if param_value is None:
-                        return None
-                    
-                    # Validate based on parameter type
-                    if param_id == "100":  # Temperature
-                        if isinstance(param_value, (int, float)) and -40.0 <= param_value <= 80.0:
-                            return round(float(param_value), 1)
-                    elif param_id == "101":  # Humidity
-                        if isinstance(param_value, (int, float)) and 0.0 <= param_value <= 100.0:
-                            return round(float(param_value), 1)
-                    elif param_id == "103":  # CO2
-                        if isinstance(param_value, (int, float)) and 0 <= param_value <= 10000:
-                            return int(param_value)
-                
-                return None
-            
-            # Extension-based CO2 concentration validation
-            elif self._key == "extension:co2-2006:co2-concentration":
-                if isinstance(value, (int, float)):
-                    # CO2 range: 0 to 10000 ppm
-                    if 0 <= value <= 10000:
-                        return int(value)
-                elif isinstance(value, str):
-                    try:
-                        co2_value = float(value)
-                        if 0 <= co2_value <= 10000:
-                            return int(co2_value)
-                    except ValueError:
-                        pass
-                _LOGGER.debug("Could not parse CO2 concentration value: %s", value)
-                return None
-            
-            # Extension-based temperature sensors validation
-            elif self._key in ["extension:co2-2006:temperature", "extension:climate-2011:temperature"]:
-                if isinstance(value, (int, float)):
-                    # Temperature range: -40°C to +80°C
-                    if -40.0 <= value <= 80.0:
-                        return round(float(value), 1)
-                elif isinstance(value, str):
-                    try:
-                        temp_value = float(value)
-                        if -40.0 <= temp_value <= 80.0:
-                            return round(temp_value, 1)
-                    except ValueError:
-                        pass
-                _LOGGER.debug("Could not parse temperature value: %s", value)
-                return None
-            
-            # Extension-based humidity validation
-            elif self._key == "extension:climate-2011:humidity":
-                if isinstance(value, (int, float)):
-                    # Humidity range: 0% to 100%
-                    if 0.0 <= value <= 100.0:
-                        return round(float(value), 1)
-                elif isinstance(value, str):
-                    try:
-                        hum_value = float(value)
-                        if 0.0 <= hum_value <= 100.0:
-                            return round(hum_value, 1)
-                    except ValueError:
-                        pass
-                _LOGGER.debug("Could not parse humidity value: %s", value)
-                return None
-            
-            # Extension-based VPD validation
-            elif self._key == "extension:climate-2011:vpd":
-                if isinstance(value, (int, float)):
-                    # VPD range: 0 to 10 kPa (reasonable range for plants)
-                    if 0.0 <= value <= 10.0:
-                        return round(float(value), 2)
-                elif isinstance(value, str):
-                    try:
-                        vpd_value = float(value)
-                        if 0.0 <= vpd_value <= 10.0:
-                            return round(vpd_value, 2)
-                    except ValueError:
-                        pass
-                _LOGGER.debug("Could not parse VPD value: %s", value)
-                return None
-            
+        if self._validator is None:
             # Default: return the value as-is if no specific validation
             return value
-            
+        
+        try:
+            return self._validator(self._key, value)
         except (ValueError, TypeError) as err:
             _LOGGER.warning("Value validation failed for %s: %s (error: %s)", 
                           self._key, value, err)
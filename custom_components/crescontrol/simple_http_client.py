@@ -5,11 +5,16 @@ This replaces the complex API client with a working implementation.
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional
-from aiohttp import ClientSession, ClientTimeout, ClientError
+from typing import Dict, Any, Iterable, Optional
+from aiohttp import ClientSession, ClientTimeout
+
+from .websocket_client import CresControlWebSocketError, is_error_response
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds to wait for all responses to a batch of commands or queries
+RESPONSE_TIMEOUT_SECONDS = 5
+
 
 class SimpleCresControlHTTPClient:
     """Simplified HTTP client that actually works with CresControl device."""
@@ -26,6 +31,7 @@ class SimpleCresControlHTTPClient:
         self.port = port
         self.session = session
         self.base_url = f"http://{host}:{port}"
+        self.ws_url = f"ws://{host}:81/websocket"
         
     async def test_connectivity(self) -> bool:
         """Test if we can connect to the device.
@@ -55,10 +61,8 @@ class SimpleCresControlHTTPClient:
         Returns:
             Response value or None if failed
         """
-        ws_url = f"ws://{self.host}:81/websocket"
-        
         try:
-            async with self.session.ws_connect(ws_url, timeout=30) as ws:
+            async with self.session.ws_connect(self.ws_url, timeout=30) as ws:
                 # Send command
                 await ws.send_str(command)
                 
@@ -68,10 +72,9 @@ class SimpleCresControlHTTPClient:
                     response = msg.data
                     
                     # Parse CresControl format: "parameter::value"
-                    if "::" in response:
-                        param, value = response.split("::", 1)
-                        if param.strip() == command:
-                            return value.strip()
+                    param, sep, value = response.partition("::")
+                    if sep and param.strip() == command:
+                        return value.strip()
                     
                     return response
                     
@@ -101,33 +104,127 @@ class SimpleCresControlHTTPClient:
         Returns:
             True if successful, False otherwise
         """
-        # Convert value to string format expected by device
-        if isinstance(value, bool):
-            value_str = "1" if value else "0"
-        else:
-            value_str = str(value)
-        
-        command = f"{parameter}={value_str}"
+        command = f"{parameter}={self._format_value(value)}"
         result = await self.send_command_via_websocket(command)
         return result is not None
     
-    async def get_multiple_values(self, parameters: list[str]) -> Dict[str, str]:
+    async def set_multiple_values(self, values: Dict[str, Any]) -> bool:
+        """Set several parameter values over one connection.
+        
+        Commands are written in order on a single WebSocket, so a later
+        command (e.g. a duty cycle) is applied after an earlier one (e.g.
+        enabling the output).
+        
+        Args:
+            values: Mapping of parameter names to values, in the order to apply
+            
+        Returns:
+            True if the device confirmed every command, False otherwise
+        """
+        if not values:
+            return True
+        
+        unconfirmed = set(values)
+        try:
+            async with self.session.ws_connect(self.ws_url, timeout=30) as ws:
+                for parameter, value in values.items():
+                    await ws.send_str(f"{parameter}={self._format_value(value)}")
+                
+                async def collect_confirmations() -> None:
+                    while unconfirmed:
+                        msg = await ws.receive()
+                        if msg.type.name != 'TEXT':
+                            break
+                        
+                        # Only a "parameter::value" reply to one of our commands
+                        # confirms it; other pushes are ignored
+                        param, sep, value = msg.data.partition("::")
+                        param = param.strip()
+                        if not sep or param not in unconfirmed:
+                            continue
+                        if is_error_response(value.strip()):
+                            _LOGGER.warning("Device rejected %s: %s", param, value.strip())
+                            break
+                        unconfirmed.discard(param)
+                
+                await asyncio.wait_for(collect_confirmations(), timeout=RESPONSE_TIMEOUT_SECONDS)
+                return not unconfirmed
+                
+        except asyncio.TimeoutError:
+            _LOGGER.warning(
+                "No confirmation for %d of %d commands", len(unconfirmed), len(values)
+            )
+            return False
+        except Exception as e:
+            _LOGGER.error("WebSocket batch command failed: %s", e)
+            return False
+    
+    @staticmethod
+    def _format_value(value: Any) -> str:
+        """Convert a value to the string format expected by the device."""
+        if isinstance(value, bool):
+            return "1" if value else "0"
+        return str(value)
+    
+    async def get_multiple_values(self, parameters: Iterable[str]) -> Dict[str, str]:
         """Get multiple parameter values efficiently.
         
+        All queries are written to one connection up front and the responses
+        are then matched back by parameter name, so the batch costs a single
+        round trip rather than one per parameter.
+        
         Args:
-            parameters: List of parameter names
+            parameters: Parameter names
             
         Returns:
-            Dict mapping parameter names to values
+            Dict mapping parameter names to values; parameters the device did
+            not answer in time are left out
+            
+        Raises:
+            CresControlWebSocketError: If no parameter was answered at all
         """
         results = {}
+        requested = set(parameters)
+        if not requested:
+            return results
         
-        # For WebSocket, we need to send commands one by one
-        for param in parameters:
-            value = await self.get_value(param)
-            if value is not None:
-                results[param] = value
+        try:
+            # Reuse one connection for the whole batch instead of one per parameter
+            async with self.session.ws_connect(self.ws_url, timeout=30) as ws:
+                for param in requested:
+                    await ws.send_str(param)
+                
+                async def collect_responses() -> None:
+                    while len(results) < len(requested):
+                        msg = await ws.receive()
+                        if msg.type.name != 'TEXT':
+                            _LOGGER.debug("WebSocket closed during batch request")
+                            break
+                        
+                        # Parse CresControl format: "parameter::value"
+                        response = msg.data
+                        resp_param, sep, value = response.partition("::")
+                        if sep:
+                            resp_param = resp_param.strip()
+                            if resp_param in requested:
+                                results[resp_param] = value.strip()
                 
+                # One deadline for the whole batch instead of one per response
+                await asyncio.wait_for(collect_responses(), timeout=RESPONSE_TIMEOUT_SECONDS)
+                    
+        except asyncio.TimeoutError:
+            _LOGGER.debug(
+                "No response for %d of %d parameters",
+                len(requested) - len(results), len(requested),
+            )
+        except Exception as e:
+            _LOGGER.error("WebSocket batch request failed: %s", e)
+        
+        # Partial results are still usable; nothing at all is a failed poll
+        if not results:
+            raise CresControlWebSocketError(
+                f"No response for any of {len(requested)} parameters"
+            )
         return results
 
 
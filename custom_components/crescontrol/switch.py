@@ -7,7 +7,7 @@ Simplified switch implementation focusing on core controls only.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.core import HomeAssistant
@@ -20,6 +20,18 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Device string values mapped to switch state
+_BOOL_MAP = {
+    "true": True,
+    "1": True,
+    "on": True,
+    "enabled": True,
+    "false": False,
+    "0": False,
+    "off": False,
+    "disabled": False,
+}
+
 
 # Core switch definitions - only parameters confirmed to exist on device
 CORE_SWITCHES = [
@@ -100,11 +112,7 @@ class CresControlSwitch(CoordinatorEntity, SwitchEntity):
             if isinstance(raw_value, bool):
                 return raw_value
             elif isinstance(raw_value, str):
-                value_lower = raw_value.strip().lower()
-                if value_lower in ("true", "1", "on", "enabled"):
-                    return True
-                elif value_lower in ("false", "0", "off", "disabled"):
-                    return False
+                return _BOOL_MAP.get(raw_value.strip().lower())
             elif isinstance(raw_value, (int, float)):
                 return bool(raw_value)
         except (TypeError, ValueError):
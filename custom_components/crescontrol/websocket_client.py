@@ -11,15 +11,85 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, Optional, Callable, Set
+from typing import Any, Deque, Dict, Iterable, Optional, Callable, Set, Tuple
 import aiohttp
 from aiohttp import ClientSession, WSMsgType
 
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
+# Window in seconds for coalescing updates delivered to batch data handlers
+BATCH_WINDOW_SECONDS = 0.01
+
+# Seconds to wait for the device to answer one request before giving up on it
+REPLY_TIMEOUT_SECONDS = 0.5
+
+# Requests that may await their reply at once before the next one is sent
+MAX_PENDING_REPLIES = 4
+
+# Core parameters requested on connect and re-requested by the periodic
+# refresh; these are confirmed to work with the real device
+SUBSCRIPTION_PARAMETERS = (
+    # Voltage inputs
+    'in-a:voltage',      # ✅ Confirmed working
+    'in-b:voltage',      # Test if available
+
+    # Fan monitoring
+    'fan:enabled',       # ✅ Confirmed working  
+    'fan:duty-cycle',    # ✅ Confirmed working
+    'fan:rpm',           # Fan RPM monitoring
+
+    # Output controls
+    'out-a:enabled',     # ✅ Confirmed working
+    'out-a:voltage',     # ✅ Confirmed working
+    'out-b:enabled',     # ✅ Confirmed working
+    'out-b:voltage',     # ✅ Confirmed working
+    'out-c:enabled',     # Likely working (same pattern)
+    'out-c:voltage',     # Likely working (same pattern)
+    'out-d:enabled',     # Likely working (same pattern)
+    'out-d:voltage',     # Likely working (same pattern)
+    'out-e:enabled',     # Likely working (same pattern)
+    'out-e:voltage',     # Likely working (same pattern)
+    'out-f:enabled',     # Likely working (same pattern)
+    'out-f:voltage',     # Likely working (same pattern)
+
+    # Extension-based sensors (CO2 and climate sensors)
+    'extension:co2-2006:co2-concentration',    # CO2 concentration
+    'extension:co2-2006:temperature',          # CO2 sensor temperature
+    'extension:climate-2011:temperature',      # Air temperature
+    'extension:climate-2011:humidity',         # Humidity
+    'extension:climate-2011:vpd',              # Vapor Pressure Deficit
+
+    # Note: switch parameters may return error responses on some devices
+    # 'switch-12v:enabled', 'switch-24v-a:enabled', 'switch-24v-b:enabled'
+)
+
+
+def is_error_response(value: str) -> bool:
+    """Return True if a device value is a JSON error object.
+    
+    The device reports failures as e.g. ``{"error":"unknown parameter"}``.
+    Parsing the object rather than matching a string prefix also accepts
+    variations in whitespace and key order.
+    
+    Parameters
+    ----------
+    value: str
+        Value part of a ``parameter::value`` message.
+    """
+    if not value.startswith("{"):
+        return False
+    try:
+        parsed = json_loads(value)
+    except JSON_DECODE_EXCEPTIONS:
+        return False
+    return isinstance(parsed, dict) and "error" in parsed
+
 
 class CresControlWebSocketError(Exception):
     """WebSocket-related errors."""
@@ -75,8 +145,15 @@ class CresControlWebSocketClient:
         
         # Data handling
         self._data_handlers: Set[Callable] = set()
+        self._batch_data_handlers: Set[Callable] = set()
+        self._pending_batch: Dict[str, str] = {}
+        self._batch_flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
         self._last_data: Dict[str, str] = {}
         self._subscribed_parameters: Set[str] = set()
+        self._pending_replies: Dict[str, asyncio.Future] = {}
+        self._reply_timeout = REPLY_TIMEOUT_SECONDS
+        self._max_pending_replies = MAX_PENDING_REPLIES
         
         # Periodic data refresh (since device doesn't send continuous updates)
         self._refresh_task: Optional[asyncio.Task] = None
@@ -130,10 +207,8 @@ class CresControlWebSocketClient:
             # Start message handling task
             self._connection_task = asyncio.create_task(self._handle_messages())
             
-            # Subscribe to initial parameters for real-time updates
-            await self._subscribe_to_updates()
-            
-            # Start periodic data refresh task
+            # Subscribe and start periodic data refresh in the background, so
+            # connecting does not wait for the device to answer every request
             self._refresh_task = asyncio.create_task(self._periodic_refresh())
             
             return True
@@ -161,32 +236,33 @@ class CresControlWebSocketClient:
         _LOGGER.info("Disconnecting from WebSocket at %s", self._ws_url)
         self._should_reconnect = False
         
-        # Cancel reconnection task
-        if self._reconnect_task:
-            self._reconnect_task.cancel()
-            try:
-                await self._reconnect_task
-            except asyncio.CancelledError:
-                pass
-            self._reconnect_task = None
+        # Cancel reconnection, refresh and message handling tasks together
+        tasks = [
+            task
+            for task in (self._reconnect_task, self._refresh_task, self._connection_task)
+            if task
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._reconnect_task = None
+        self._refresh_task = None
+        self._connection_task = None
         
-        # Cancel refresh task
-        if self._refresh_task:
-            self._refresh_task.cancel()
-            try:
-                await self._refresh_task
-            except asyncio.CancelledError:
-                pass
-            self._refresh_task = None
+        # Drop any updates still waiting for the batch window
+        if self._batch_flush_handle:
+            self._batch_flush_handle.cancel()
+            self._batch_flush_handle = None
+        self._pending_batch.clear()
         
-        # Cancel message handling task
-        if self._connection_task:
-            self._connection_task.cancel()
-            try:
-                await self._connection_task
-            except asyncio.CancelledError:
-                pass
-            self._connection_task = None
+        # Cancel async batch handlers that are still running
+        batch_tasks = list(self._batch_tasks)
+        for task in batch_tasks:
+            task.cancel()
+        await asyncio.gather(*batch_tasks, return_exceptions=True)
+        self._batch_tasks.clear()
+        
+        self._release_pending_replies()
         
         # Close WebSocket connection
         if self._websocket and not self._websocket.closed:
@@ -261,7 +337,9 @@ class CresControlWebSocketClient:
                          self._max_reconnect_attempts)
 
     async def _periodic_refresh(self) -> None:
-        """Periodically request fresh data since device doesn't send continuous updates."""
+        """Subscribe, then periodically request fresh data since device doesn't send continuous updates."""
+        await self._subscribe_to_updates()
+        
         while self._should_reconnect and self.is_connected:
             try:
                 await asyncio.sleep(self._refresh_interval)
@@ -273,13 +351,7 @@ class CresControlWebSocketClient:
                 if self._subscribed_parameters:
                     _LOGGER.debug("Requesting fresh data for %d parameters", len(self._subscribed_parameters))
                     
-                    for param in self._subscribed_parameters:
-                        try:
-                            await self.send_command(param)
-                            # Small delay to avoid overwhelming the device
-                            await asyncio.sleep(0.05)
-                        except Exception as e:
-                            _LOGGER.debug("Failed to refresh parameter %s: %s", param, e)
+                    await self._send_commands(self._subscribed_parameters)
                             
             except asyncio.CancelledError:
                 break
@@ -289,62 +361,88 @@ class CresControlWebSocketClient:
         
         _LOGGER.debug("Periodic refresh task stopped")
 
+    async def _send_commands(self, commands: Iterable[str]) -> int:
+        """Send several query commands in order, pipelining the replies.
+        
+        Up to ``MAX_PENDING_REPLIES`` commands may await their reply at
+        once. Each further command is sent when the oldest reply arrives or
+        its reply timeout expires, so requests go out no faster than the
+        device answers them without paying a full round trip per command.
+        Failures are logged and skipped so one bad parameter does not stop
+        the others from being requested.
+        
+        Parameters
+        ----------
+        commands: Iterable[str]
+            Command strings to send.
+            
+        Returns
+        -------
+        int
+            Number of commands sent successfully.
+        """
+        loop = asyncio.get_running_loop()
+        in_flight: Deque[Tuple[str, asyncio.Future, float]] = deque()
+        sent = 0
+        try:
+            for cmd in commands:
+                if len(in_flight) >= self._max_pending_replies:
+                    await self._wait_for_reply(*in_flight.popleft())
+                
+                reply = self._pending_replies[cmd] = loop.create_future()
+                try:
+                    await self.send_command(cmd)
+                except CresControlWebSocketError as e:
+                    _LOGGER.debug("Failed to send command %s: %s", cmd, e)
+                    self._forget_reply(cmd, reply)
+                    continue
+                sent += 1
+                in_flight.append((cmd, reply, loop.time() + self._reply_timeout))
+        finally:
+            # Replies to the last commands are not needed to pace anything
+            for cmd, reply, _ in in_flight:
+                self._forget_reply(cmd, reply)
+        return sent
+
+    async def _wait_for_reply(self, cmd: str, reply: asyncio.Future, deadline: float) -> None:
+        """Wait for the reply to a sent command until its deadline."""
+        try:
+            remaining = deadline - asyncio.get_running_loop().time()
+            await asyncio.wait_for(reply, max(remaining, 0))
+        except asyncio.TimeoutError:
+            _LOGGER.debug("No reply to command %s within %ss", cmd, self._reply_timeout)
+        finally:
+            self._forget_reply(cmd, reply)
+
+    def _forget_reply(self, cmd: str, reply: asyncio.Future) -> None:
+        """Stop tracking a reply unless a newer request for cmd replaced it."""
+        if self._pending_replies.get(cmd) is reply:
+            del self._pending_replies[cmd]
+
+    def _release_pending_replies(self) -> None:
+        """Stop waiting for replies that can no longer arrive.
+        
+        The futures are resolved rather than cancelled, so a request loop
+        waiting on one carries on instead of raising ``CancelledError``
+        into a caller that was never cancelled.
+        """
+        for future in self._pending_replies.values():
+            if not future.done():
+                future.set_result(None)
+        self._pending_replies.clear()
+
     async def _subscribe_to_updates(self) -> None:
         """Subscribe to data updates by sending initial parameter requests."""
         if not self._websocket or self._websocket.closed:
             return
             
         try:
-            # Send commands for core parameters based on successful testing
-            # These parameters are confirmed to work with the real device
-            initial_commands = [
-                # Voltage inputs
-                'in-a:voltage',      # ✅ Confirmed working
-                'in-b:voltage',      # Test if available
-                
-                # Fan monitoring
-                'fan:enabled',       # ✅ Confirmed working  
-                'fan:duty-cycle',    # ✅ Confirmed working
-                'fan:rpm',           # Fan RPM monitoring
-                
-                # Output controls
-                'out-a:enabled',     # ✅ Confirmed working
-                'out-a:voltage',     # ✅ Confirmed working
-                'out-b:enabled',     # ✅ Confirmed working
-                'out-b:voltage',     # ✅ Confirmed working
-                'out-c:enabled',     # Likely working (same pattern)
-                'out-c:voltage',     # Likely working (same pattern)
-                'out-d:enabled',     # Likely working (same pattern)
-                'out-d:voltage',     # Likely working (same pattern)
-                'out-e:enabled',     # Likely working (same pattern)
-                'out-e:voltage',     # Likely working (same pattern)
-                'out-f:enabled',     # Likely working (same pattern)
-                'out-f:voltage',     # Likely working (same pattern)
-                
-                # Extension-based sensors (CO2 and climate sensors)
-                'extension:co2-2006:co2-concentration',    # CO2 concentration
-                'extension:co2-2006:temperature',          # CO2 sensor temperature
-                'extension:climate-2011:temperature',      # Air temperature
-                'extension:climate-2011:humidity',         # Humidity
-                'extension:climate-2011:vpd',              # Vapor Pressure Deficit
-                
-                # Note: switch parameters may return error responses on some devices
-                # 'switch-12v:enabled', 'switch-24v-a:enabled', 'switch-24v-b:enabled'
-            ]
-            
             # Store subscribed parameters for re-subscription after reconnection
-            self._subscribed_parameters.update(initial_commands)
+            self._subscribed_parameters.update(SUBSCRIPTION_PARAMETERS)
             
-            for cmd in initial_commands:
-                try:
-                    await self.send_command(cmd)
-                    # Small delay to avoid overwhelming the device
-                    await asyncio.sleep(0.1)
-                except Exception as e:
-                    _LOGGER.debug("Failed to send initial command %s: %s", cmd, e)
-                    continue
+            sent = await self._send_commands(SUBSCRIPTION_PARAMETERS)
             
-            _LOGGER.debug("Sent %d initial parameter requests", len(initial_commands))
+            _LOGGER.debug("Sent %d initial parameter requests", sent)
             
         except Exception as e:
             _LOGGER.warning("Failed to subscribe to updates: %s", e)
@@ -362,6 +460,33 @@ class CresControlWebSocketClient:
         self._data_handlers.add(handler)
         _LOGGER.debug("Added WebSocket data handler")
     
+    def add_batch_data_handler(self, handler: Callable[[Dict[str, str]], None]) -> None:
+        """Add a handler for batched data updates.
+        
+        Updates arriving within ``BATCH_WINDOW_SECONDS`` of each other are
+        merged and delivered in a single call, so a burst of responses
+        results in one handler invocation instead of one per message.
+        
+        Parameters
+        ----------
+        handler: Callable
+            Function to call with the accumulated updates.
+            Should accept a dict with parameter names as keys and values as strings.
+        """
+        self._batch_data_handlers.add(handler)
+        _LOGGER.debug("Added WebSocket batch data handler")
+    
+    def remove_batch_data_handler(self, handler: Callable) -> None:
+        """Remove a batch data handler.
+        
+        Parameters
+        ----------
+        handler: Callable
+            Handler function to remove.
+        """
+        self._batch_data_handlers.discard(handler)
+        _LOGGER.debug("Removed WebSocket batch data handler")
+    
     def remove_data_handler(self, handler: Callable) -> None:
         """Remove a data handler.
         
@@ -420,6 +545,7 @@ class CresControlWebSocketClient:
             "refreshing": self._refresh_task is not None,
             "refresh_interval": self._refresh_interval,
             "data_handlers": len(self._data_handlers),
+            "batch_data_handlers": len(self._batch_data_handlers),
             "last_data_count": len(self._last_data),
             "subscribed_parameters": len(self._subscribed_parameters),
         }
@@ -453,6 +579,7 @@ class CresControlWebSocketClient:
         finally:
             self._connected = False
             self._last_disconnect_time = dt_util.utcnow()
+            self._release_pending_replies()
             _LOGGER.debug("WebSocket message handler stopped")
             
             # Stop refresh task
@@ -475,35 +602,76 @@ class CresControlWebSocketClient:
         """
         try:
             # CresControl WebSocket uses format: "parameter::value"
-            if "::" in message:
-                parts = message.split("::", 1)
-                if len(parts) == 2:
-                    param, value = parts
-                    param = param.strip()
-                    value = value.strip()
-                    
-                    # Skip error responses
-                    if value.startswith('{"error"'):
-                        _LOGGER.debug("Skipping error response for %s: %s", param, value)
-                        return
-                    
-                    # Update last data
-                    self._last_data[param] = value
-                    
-                    # Notify data handlers
-                    data_update = {param: value}
-                    for handler in self._data_handlers:
-                        try:
-                            if asyncio.iscoroutinefunction(handler):
-                                await handler(data_update)
-                            else:
-                                handler(data_update)
-                        except Exception as err:
-                            _LOGGER.error("Error in WebSocket data handler: %s", err)
-                    
-                    _LOGGER.debug("Processed WebSocket data update: %s = %s", param, value)
+            sep = message.find("::")
+            if sep >= 0:
+                # Intern the key so repeated updates share one string object
+                param = sys.intern(message[:sep].strip())
+                value = message[sep + 2:].strip()
+                
+                # Any answer, including an error, releases a waiting request
+                reply = self._pending_replies.get(param)
+                if reply is not None and not reply.done():
+                    reply.set_result(value)
+                
+                # Skip error responses
+                if is_error_response(value):
+                    _LOGGER.debug("Skipping error response for %s: %s", param, value)
+                    return
+                
+                # Update last data
+                self._last_data[param] = value
+                
+                # Notify data handlers
+                data_update = {param: value}
+                for handler in self._data_handlers:
+                    try:
+                        if asyncio.iscoroutinefunction(handler):
+                            await handler(data_update)
+                        else:
+                            handler(data_update)
+                    except Exception as err:
+                        _LOGGER.error("Error in WebSocket data handler: %s", err)
+                
+                # Queue for batch handlers, flushed once the window expires
+                if self._batch_data_handlers:
+                    self._pending_batch[param] = value
+                    if self._batch_flush_handle is None:
+                        self._batch_flush_handle = asyncio.get_running_loop().call_later(
+                            BATCH_WINDOW_SECONDS, self._flush_batch
+                        )
+                
+                _LOGGER.debug("Processed WebSocket data update: %s = %s", param, value)
             else:
                 _LOGGER.debug("Received WebSocket message without delimiter: %s", message)
                 
         except Exception as err:
-            _LOGGER.error("Error processing CresControl WebSocket message: %s", err)
\ No newline at end of file
+            _LOGGER.error("Error processing CresControl WebSocket message: %s", err)
+    
+    def _flush_batch(self) -> None:
+        """Deliver accumulated updates to all batch data handlers."""
+        self._batch_flush_handle = None
+        if not self._pending_batch:
+            return
+        
+        batch = self._pending_batch
+        self._pending_batch = {}
+        
+        # Each handler gets its own copy so one cannot change another's view
+        for handler in self._batch_data_handlers:
+            try:
+                if asyncio.iscoroutinefunction(handler):
+                    task = asyncio.create_task(handler(dict(batch)))
+                    self._batch_tasks.add(task)
+                    task.add_done_callback(self._batch_task_done)
+                else:
+                    handler(dict(batch))
+            except Exception as err:
+                _LOGGER.error("Error in WebSocket batch data handler: %s", err)
+        
+        _LOGGER.debug("Flushed %d batched WebSocket updates", len(batch))
+    
+    def _batch_task_done(self, task: asyncio.Task) -> None:
+        """Forget a finished batch handler task and log its failure, if any."""
+        self._batch_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            _LOGGER.error("Error in WebSocket batch data handler: %s", task.exception())
@@ -4,59 +4,85 @@ Final test of all discovered CO2 and climate sensor parameters.
 """
 
 import asyncio
+import sys
 import aiohttp
 
+# Output section separators
+SEPARATOR = "=" * 50
+SUBSEPARATOR = "-" * 30
+
+# Plain-text values the device reports instead of a reading
+ERROR_VALUES = frozenset(("error", "n/a", "unknown"))
+
+# All discovered working parameters as (parameter, name, unit)
+SENSOR_PARAMS = (
+    ("extension:climate-2011:temperature", "Climate Temperature", "°C"),
+    ("extension:climate-2011:humidity", "Climate Humidity", "%"),
+    ("extension:co2-2006:co2-concentration", "CO2 Concentration", "ppm"),
+    ("extension:co2-2006:temperature", "CO2 Temperature", "°C"),
+)
+SENSOR_LABELS = {param: (name, unit) for param, name, unit in SENSOR_PARAMS}
+EXPECTED_PARAMS = frozenset(SENSOR_LABELS)
+
 async def test_all_sensors():
     """Test all discovered sensor parameters."""
     
     print("Final CO2 and Climate Sensor Test")
     print("Device: 192.168.105.15:81")
-    print("=" * 50)
-    
-    # All discovered working parameters
-    sensor_params = [
-        ("extension:climate-2011:temperature", "Climate Temperature", "°C"),
-        ("extension:climate-2011:humidity", "Climate Humidity", "%"),
-        ("extension:co2-2006:co2-concentration", "CO2 Concentration", "ppm"),
-        ("extension:co2-2006:temperature", "CO2 Temperature", "°C"),
-    ]
+    print(SEPARATOR)
     
     async with aiohttp.ClientSession() as session:
         async with session.ws_connect('ws://192.168.105.15:81/websocket', timeout=10) as ws:
             
             print("Testing individual parameters:")
-            print("-" * 30)
+            print(SUBSEPARATOR)
             
             working_params = []
             
-            for param, name, unit in sensor_params:
+            # Send every query back to back, then collect the responses
+            for param, _, _ in SENSOR_PARAMS:
                 await ws.send_str(param)
-                try:
-                    msg = await asyncio.wait_for(ws.receive(), timeout=3)
-                    if msg.type == aiohttp.WSMsgType.TEXT:
-                        response = msg.data.strip()
-                        
-                        if "::" in response:
-                            _, value = response.split("::", 1)
-                            value = value.strip()
-                            
-                            if not (value.startswith('{"error"') or 
-                                   value.lower() in ['error', 'n/a', 'unknown']):
-                                print(f"✅ {name:<20}: {value} {unit}")
-                                working_params.append((param, value, unit))
-                            else:
-                                print(f"❌ {name:<20}: {value}")
-                        
-                except asyncio.TimeoutError:
+            
+            received = set()
+            
+            async def drain() -> None:
+                while received != EXPECTED_PARAMS:
+                    msg = await ws.receive()
+                    if msg.type != aiohttp.WSMsgType.TEXT:
+                        break
+                    
+                    param, sep, value = msg.data.strip().partition("::")
+                    param = param.strip()
+                    if not sep or param not in EXPECTED_PARAMS or param in received:
+                        continue
+                    
+                    received.add(param)
+                    name, unit = SENSOR_LABELS[param]
+                    value = value.strip()
+                    
+                    if not (value.startswith('{"error"') or 
+                           value.lower() in ERROR_VALUES):
+                        print(f"✅ {name:<20}: {value} {unit}")
+                        working_params.append((param, value, unit))
+                    else:
+                        print(f"❌ {name:<20}: {value}")
+            
+            # One deadline covers the whole drain instead of one per receive
+            try:
+                await asyncio.wait_for(drain(), timeout=5)
+            except asyncio.TimeoutError:
+                pass
+            
+            missing = EXPECTED_PARAMS - received
+            for param, name, _ in SENSOR_PARAMS:
+                if param in missing:
                     print(f"⏱️ {name:<20}: TIMEOUT")
-                
-                await asyncio.sleep(0.3)
             
             # Test combined query
             print(f"\nTesting combined query:")
-            print("-" * 30)
+            print(SUBSEPARATOR)
             
-            combined_query = ";".join([param for param, _, _ in sensor_params])
+            combined_query = ";".join([param for param, _, _ in SENSOR_PARAMS])
             await ws.send_str(combined_query)
             
             try:
@@ -64,17 +90,17 @@ async def test_all_sensors():
                 response = msg.data.strip()
                 print(f"Combined response: {response}")
                 
-                if "::" in response:
+                _, sep, values = response.partition("::")
+                if sep:
                     # Parse combined response
-                    _, values = response.split("::", 1)
                     value_list = values.split(";")
                     
                     print(f"\nParsed combined values:")
-                    for i, (param, name, unit) in enumerate(sensor_params):
+                    for i, (param, name, unit) in enumerate(SENSOR_PARAMS):
                         if i < len(value_list):
                             value = value_list[i].strip()
                             if not (value.startswith('{"error"') or 
-                                   value.lower() in ['error', 'n/a', 'unknown']):
+                                   value.lower() in ERROR_VALUES):
                                 print(f"  {name}: {value} {unit}")
                             else:
                                 print(f"  {name}: ERROR")
@@ -88,17 +114,20 @@ async def main():
     """Run final sensor test."""
     working_params = await test_all_sensors()
     
-    print("\n" + "=" * 50)
-    print("INTEGRATION UPDATE SUMMARY")
-    print("=" * 50)
+    # Collect the summary and write it in one go
+    out = [
+        "\n" + SEPARATOR,
+        "INTEGRATION UPDATE SUMMARY",
+        SEPARATOR,
+    ]
     
     if working_params:
-        print(f"\n✅ Found {len(working_params)} working sensor parameters:")
-        print("\nUpdate custom_components/crescontrol/sensor.py with:")
-        print("```python")
-        print("CORE_SENSORS = [")
-        print("    # Existing sensors...")
-        print("    ")
+        out.append(f"\n✅ Found {len(working_params)} working sensor parameters:")
+        out.append("\nUpdate custom_components/crescontrol/sensor.py with:")
+        out.append("```python")
+        out.append("CORE_SENSORS = [")
+        out.append("    # Existing sensors...")
+        out.append("    ")
         
         for param, value, unit in working_params:
             param_parts = param.split(":")
@@ -120,26 +149,28 @@ async def main():
                 unit_const = "CONCENTRATION_PARTS_PER_MILLION"
                 icon = "mdi:molecule-co2"
             
-            print(f'    {{')
-            print(f'        "key": "{param}",')
-            print(f'        "name": "{sensor_name}",')
-            print(f'        "unit": {unit_const},')
-            print(f'        "device_class": {device_class},')
-            print(f'        "state_class": {state_class},')
-            print(f'        "icon": "{icon}",')
-            print(f'    }},')
+            out.append(f'    {{')
+            out.append(f'        "key": "{param}",')
+            out.append(f'        "name": "{sensor_name}",')
+            out.append(f'        "unit": {unit_const},')
+            out.append(f'        "device_class": {device_class},')
+            out.append(f'        "state_class": {state_class},')
+            out.append(f'        "icon": "{icon}",')
+            out.append(f'    }},')
         
-        print("]")
-        print("```")
+        out.append("]")
+        out.append("```")
         
-        print(f"\nAlso update websocket_client.py to subscribe to these parameters:")
-        print("```python")
+        out.append(f"\nAlso update websocket_client.py to subscribe to these parameters:")
+        out.append("```python")
         for param, _, _ in working_params:
-            print(f"                '{param}',")
-        print("```")
+            out.append(f"                '{param}',")
+        out.append("```")
         
     else:
-        print("\n❌ No working parameters found.")
+        out.append("\n❌ No working parameters found.")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -6,38 +6,77 @@ Test the periodic refresh functionality to ensure continuous data updates.
 import asyncio
 import aiohttp
 import logging
-from datetime import datetime
+from collections import Counter, deque
+from datetime import datetime, timedelta
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Output section separators
+SEPARATOR = "=" * 50
+SUBSEPARATOR = "-" * 30
+
+# Number of recent updates kept for inspection; counters cover all updates
+MAX_RETAINED_UPDATES = 256
+
+# Seconds between the client's refresh requests
+REFRESH_INTERVAL_SECONDS = 8
+
+# Collection ends early once this many updates over this many parameters arrive,
+# provided at least one of them came after the first refresh cycle
+MIN_UPDATES = 11
+MIN_UNIQUE_PARAMETERS = 4
+
 class DataCollector:
     """Collect and analyze data updates."""
     
+    __slots__ = (
+        "updates",
+        "parameter_counts",
+        "total_updates",
+        "refreshed_updates",
+        "first_timestamp",
+        "enough_data",
+    )
+    
     def __init__(self):
-        self.updates = []
-        self.parameter_counts = {}
+        self.updates = deque(maxlen=MAX_RETAINED_UPDATES)
+        self.parameter_counts = Counter()
+        self.total_updates = 0
+        self.refreshed_updates = 0
+        self.first_timestamp = None
+        self.enough_data = asyncio.Event()
     
     def handle_data(self, data):
         """Handle incoming data updates."""
         timestamp = datetime.now()
         self.updates.append((timestamp, data))
+        self.total_updates += 1
+        if self.first_timestamp is None:
+            self.first_timestamp = timestamp
+        elif timestamp > self.first_timestamp + timedelta(seconds=REFRESH_INTERVAL_SECONDS):
+            self.refreshed_updates += 1
+        
+        self.parameter_counts.update(data.keys())
         
-        for param in data:
-            self.parameter_counts[param] = self.parameter_counts.get(param, 0) + 1
+        if (self.total_updates >= MIN_UPDATES
+                and len(self.parameter_counts) >= MIN_UNIQUE_PARAMETERS
+                and self.refreshed_updates):
+            self.enough_data.set()
         
-        logger.info(f"[{timestamp.strftime('%H:%M:%S')}] Data: {data}")
+        logger.debug("[%s] Data: %s", timestamp.strftime('%H:%M:%S'), data)
     
     def get_summary(self):
         """Get summary of collected data."""
         return {
-            "total_updates": len(self.updates),
+            "total_updates": self.total_updates,
+            "refreshed_updates": self.refreshed_updates,
             "parameter_counts": self.parameter_counts,
             "unique_parameters": len(self.parameter_counts),
             "time_span": (
-                (self.updates[-1][0] - self.updates[0][0]).total_seconds()
-                if len(self.updates) > 1 else 0
+                (self.updates[-1][0] - self.first_timestamp).total_seconds()
+                if self.total_updates > 1 else 0
             )
         }
 
@@ -45,6 +84,20 @@ class DataCollector:
 class RefreshingWebSocketClient:
     """WebSocket client with periodic refresh for testing."""
     
+    __slots__ = (
+        "_host",
+        "_ws_url",
+        "_session",
+        "_websocket",
+        "_connected",
+        "_should_run",
+        "_connection_task",
+        "_refresh_task",
+        "_refresh_interval",
+        "_data_handlers",
+        "_subscribed_parameters",
+    )
+    
     def __init__(self, host: str, session: aiohttp.ClientSession):
         self._host = host
         self._ws_url = f"ws://{host}:81/websocket"
@@ -54,7 +107,7 @@ class RefreshingWebSocketClient:
         self._should_run = True
         self._connection_task = None
         self._refresh_task = None
-        self._refresh_interval = 8  # Refresh every 8 seconds
+        self._refresh_interval = REFRESH_INTERVAL_SECONDS
         self._data_handlers = set()
         self._subscribed_parameters = {
             'extension:climate-2011:temperature',
@@ -68,7 +121,7 @@ class RefreshingWebSocketClient:
     async def connect(self):
         """Connect to WebSocket."""
         try:
-            logger.info(f"Connecting to {self._ws_url}")
+            logger.info("Connecting to %s", self._ws_url)
             self._websocket = await self._session.ws_connect(self._ws_url, timeout=10, heartbeat=30)
             self._connected = True
             
@@ -82,7 +135,7 @@ class RefreshingWebSocketClient:
             return True
             
         except Exception as e:
-            logger.error(f"Connection failed: {e}")
+            logger.error("Connection failed: %s", e)
             return False
     
     async def _handle_messages(self):
@@ -92,22 +145,22 @@ class RefreshingWebSocketClient:
                 if msg.type == aiohttp.WSMsgType.TEXT:
                     data = msg.data.strip()
                     
-                    if "::" in data:
-                        param, value = data.split("::", 1)
+                    param, sep, value = data.partition("::")
+                    if sep:
                         update = {param.strip(): value.strip()}
                         
                         for handler in self._data_handlers:
                             try:
                                 handler(update)
                             except Exception as e:
-                                logger.error(f"Handler error: {e}")
+                                logger.error("Handler error: %s", e)
                 
                 elif msg.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.ERROR):
                     logger.info("WebSocket connection closed")
                     break
         
         except Exception as e:
-            logger.error(f"Message handler error: {e}")
+            logger.error("Message handler error: %s", e)
         
         finally:
             self._connected = False
@@ -127,16 +180,15 @@ class RefreshingWebSocketClient:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Refresh error: {e}")
+                logger.error("Refresh error: %s", e)
     
     async def _request_all_parameters(self):
-        """Request all subscribed parameters."""
+        """Request all subscribed parameters in one burst."""
         for param in self._subscribed_parameters:
             try:
                 await self._websocket.send_str(param)
-                await asyncio.sleep(0.1)  # Small delay
             except Exception as e:
-                logger.debug(f"Failed to request {param}: {e}")
+                logger.debug("Failed to request %s: %s", param, e)
     
     def add_data_handler(self, handler):
         """Add data handler."""
@@ -162,7 +214,7 @@ async def test_periodic_refresh():
     
     print("Testing Periodic Data Refresh")
     print("Device: 192.168.105.15:81")
-    print("=" * 50)
+    print(SEPARATOR)
     
     collector = DataCollector()
     
@@ -178,19 +230,23 @@ async def test_periodic_refresh():
                 return
             
             print("✅ Connected successfully")
-            print("Collecting data for 60 seconds...")
-            print("-" * 30)
+            print("Collecting data for up to 60 seconds...")
+            print(SUBSEPARATOR)
             
-            # Collect data for 60 seconds
-            await asyncio.sleep(60)
+            # Collect data until the success criteria are met or 60 seconds pass
+            try:
+                await asyncio.wait_for(collector.enough_data.wait(), timeout=60)
+            except asyncio.TimeoutError:
+                pass
             
             # Analyze results
             summary = collector.get_summary()
             
-            print("\n" + "=" * 50)
+            print("\n" + SEPARATOR)
             print("RESULTS")
-            print("=" * 50)
+            print(SEPARATOR)
             print(f"Total updates received: {summary['total_updates']}")
+            print(f"Updates after first refresh cycle: {summary['refreshed_updates']}")
             print(f"Unique parameters: {summary['unique_parameters']}")
             print(f"Time span: {summary['time_span']:.1f} seconds")
             print(f"Average update rate: {summary['total_updates'] / max(summary['time_span'], 1):.2f} updates/second")
@@ -200,12 +256,12 @@ async def test_periodic_refresh():
                 print(f"  {param}: {count} updates")
             
             # Evaluate success
-            if summary['total_updates'] > 10:
+            if summary['total_updates'] >= MIN_UPDATES and summary['refreshed_updates']:
                 print("\n✅ Periodic refresh is working - receiving regular updates")
             else:
                 print("\n❌ Periodic refresh may not be working - few updates received")
             
-            if summary['unique_parameters'] >= 4:
+            if summary['unique_parameters'] >= MIN_UNIQUE_PARAMETERS:
                 print("✅ Multiple parameters are being updated")
             else:
                 print("❌ Limited parameter diversity")
@@ -222,17 +278,20 @@ async def main():
     try:
         await test_periodic_refresh()
         
-        print("\n" + "=" * 50)
-        print("CONCLUSIONS")
-        print("=" * 50)
-        print("\nIf periodic refresh works:")
-        print("1. You should see regular data updates every ~8 seconds")
-        print("2. Multiple parameters should be updated")
-        print("3. This will solve the stale data issue in Home Assistant")
-        print("\nThe periodic refresh ensures:")
-        print("- Fresh data is requested regularly")
-        print("- Home Assistant entities stay up-to-date")
-        print("- No more stale sensor values")
+        # Static summary, written as one block
+        print("\n".join((
+            "\n" + SEPARATOR,
+            "CONCLUSIONS",
+            SEPARATOR,
+            "\nIf periodic refresh works:",
+            "1. You should see regular data updates every ~8 seconds",
+            "2. Multiple parameters should be updated",
+            "3. This will solve the stale data issue in Home Assistant",
+            "\nThe periodic refresh ensures:",
+            "- Fresh data is requested regularly",
+            "- Home Assistant entities stay up-to-date",
+            "- No more stale sensor values",
+        )))
         
     except KeyboardInterrupt:
         print("\nTest interrupted by user")
@@ -7,17 +7,41 @@ This is a simplified test that doesn't require Home Assistant dependencies.
 import asyncio
 import aiohttp
 import logging
-from datetime import datetime
-from typing import Dict, Set, Callable, Optional, Any
+from collections import deque
+from typing import Optional
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Output section separators
+SEPARATOR = "=" * 60
+SUBSEPARATOR = "-" * 30
+MINOR_SEPARATOR = "-" * 20
+
 # Simplified WebSocket client for testing (without Home Assistant dependencies)
 class SimpleWebSocketClient:
     """Simplified WebSocket client for testing reconnection logic."""
     
+    __slots__ = (
+        "_host",
+        "_ws_url",
+        "_session",
+        "_websocket",
+        "_connected",
+        "_should_reconnect",
+        "_reconnect_attempts",
+        "_max_reconnect_attempts",
+        "_reconnect_delay",
+        "_max_reconnect_delay",
+        "_connection_task",
+        "_reconnect_task",
+        "_data_handlers",
+        "_messages_received",
+        "_total_reconnects",
+        "_connected_event",
+    )
+    
     def __init__(self, host: str, session: aiohttp.ClientSession):
         self._host = host
         self._ws_url = f"ws://{host}:81/websocket"
@@ -34,6 +58,7 @@ class SimpleWebSocketClient:
         self._data_handlers = set()
         self._messages_received = 0
         self._total_reconnects = 0
+        self._connected_event = asyncio.Event()
     
     async def connect(self):
         """Connect with reconnection logic."""
@@ -41,15 +66,16 @@ class SimpleWebSocketClient:
             return True
         
         try:
-            logger.info(f"Connecting to {self._ws_url} (attempt {self._reconnect_attempts + 1})")
+            logger.info("Connecting to %s (attempt %d)", self._ws_url, self._reconnect_attempts + 1)
             self._websocket = await self._session.ws_connect(self._ws_url, timeout=10, heartbeat=30)
             self._connected = True
             
             if self._reconnect_attempts > 0:
-                logger.info(f"Reconnected after {self._reconnect_attempts} attempts")
+                logger.info("Reconnected after %d attempts", self._reconnect_attempts)
                 self._total_reconnects += 1
             
             self._reconnect_attempts = 0
+            self._connected_event.set()
             self._connection_task = asyncio.create_task(self._handle_messages())
             
             # Send test commands
@@ -63,19 +89,19 @@ class SimpleWebSocketClient:
             self._reconnect_attempts += 1
             
             if self._reconnect_attempts <= self._max_reconnect_attempts:
-                logger.warning(f"Connection failed (attempt {self._reconnect_attempts}): {e}")
+                logger.warning("Connection failed (attempt %d): %s", self._reconnect_attempts, e)
                 if self._should_reconnect and not self._reconnect_task:
                     self._reconnect_task = asyncio.create_task(self._reconnect_loop())
                 return False
             else:
-                logger.error(f"Failed to connect after {self._max_reconnect_attempts} attempts")
+                logger.error("Failed to connect after %d attempts", self._max_reconnect_attempts)
                 raise
     
     async def _reconnect_loop(self):
         """Reconnection loop with exponential backoff."""
         while self._should_reconnect and self._reconnect_attempts <= self._max_reconnect_attempts:
             delay = min(self._reconnect_delay * (2 ** (self._reconnect_attempts - 1)), self._max_reconnect_delay)
-            logger.info(f"Reconnecting in {delay} seconds...")
+            logger.info("Reconnecting in %s seconds...", delay)
             await asyncio.sleep(delay)
             
             if not self._should_reconnect:
@@ -95,32 +121,47 @@ class SimpleWebSocketClient:
                     self._messages_received += 1
                     data = msg.data.strip()
                     
-                    if "::" in data:
-                        param, value = data.split("::", 1)
+                    param, sep, value = data.partition("::")
+                    if sep:
                         update = {param.strip(): value.strip()}
                         
                         for handler in self._data_handlers:
                             try:
                                 handler(update)
                             except Exception as e:
-                                logger.error(f"Handler error: {e}")
+                                logger.error("Handler error: %s", e)
                 
                 elif msg.type == aiohttp.WSMsgType.CLOSE:
                     logger.info("WebSocket closed by server")
                     break
                 elif msg.type == aiohttp.WSMsgType.ERROR:
-                    logger.error(f"WebSocket error: {self._websocket.exception()}")
+                    logger.error("WebSocket error: %s", self._websocket.exception())
                     break
         
         except Exception as e:
-            logger.error(f"Message handler error: {e}")
+            logger.error("Message handler error: %s", e)
         
         finally:
             self._connected = False
+            self._connected_event.clear()
             if self._should_reconnect and not self._reconnect_task:
                 logger.info("Connection lost, starting reconnection")
                 self._reconnect_task = asyncio.create_task(self._reconnect_loop())
     
+    async def wait_connected(self, timeout: float) -> bool:
+        """Wait until a connection is established, up to timeout seconds."""
+        try:
+            await asyncio.wait_for(self._connected_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.is_connected
+    
+    async def wait_disconnected(self, timeout: float) -> bool:
+        """Wait until the message handler notices a dropped connection, up to timeout seconds."""
+        if self._connection_task:
+            await asyncio.wait({self._connection_task}, timeout=timeout)
+        return not self._connected_event.is_set()
+    
     def add_data_handler(self, handler):
         """Add data handler."""
         self._data_handlers.add(handler)
@@ -139,6 +180,7 @@ class SimpleWebSocketClient:
             await self._websocket.close()
         
         self._connected = False
+        self._connected_event.clear()
     
     @property
     def is_connected(self):
@@ -152,157 +194,181 @@ class SimpleWebSocketClient:
             "total_reconnects": self._total_reconnects,
         }
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
-logger = logging.getLogger(__name__)
+# Number of recent updates kept for inspection; update_count covers all updates
+MAX_RETAINED_UPDATES = 256
+
+# Updates expected after connecting (one per parameter requested on connect)
+MIN_INITIAL_UPDATES = 2
+
+# Shared session for all tests, created on first use and closed by main()
+_SESSION: Optional[aiohttp.ClientSession] = None
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared client session, creating it if needed."""
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        _SESSION = aiohttp.ClientSession()
+    return _SESSION
 
 class TestDataHandler:
     """Test data handler to collect WebSocket updates."""
     
+    __slots__ = ("received_data", "update_count", "initial_data")
+    
     def __init__(self):
-        self.received_data = []
+        self.received_data = deque(maxlen=MAX_RETAINED_UPDATES)
         self.update_count = 0
+        self.initial_data = asyncio.Event()
     
     def handle_data(self, data):
         """Handle incoming data updates."""
         self.received_data.append(data)
         self.update_count += 1
-        logger.info(f"Received data update #{self.update_count}: {data}")
+        logger.debug("Received data update #%d: %s", self.update_count, data)
+        
+        if self.update_count >= MIN_INITIAL_UPDATES:
+            self.initial_data.set()
 
 async def test_websocket_reconnection():
     """Test WebSocket reconnection logic."""
     
     print("Testing WebSocket Reconnection Logic")
     print("Device: 192.168.105.15:81")
-    print("=" * 60)
+    print(SEPARATOR)
     
     handler = TestDataHandler()
     
-    async with aiohttp.ClientSession() as session:
-        client = SimpleWebSocketClient("192.168.105.15", session)
-        client.add_data_handler(handler.handle_data)
+    session = await get_session()
+    client = SimpleWebSocketClient("192.168.105.15", session)
+    client.add_data_handler(handler.handle_data)
+    
+    try:
+        # Test 1: Initial connection
+        print("\nTest 1: Initial connection")
+        print(SUBSEPARATOR)
         
-        try:
-            # Test 1: Initial connection
-            print("\nTest 1: Initial connection")
-            print("-" * 30)
+        success = await client.connect()
+        if success:
+            print("✅ Initial connection successful")
             
-            success = await client.connect()
-            if success:
-                print("✅ Initial connection successful")
-                
-                # Wait for some data
-                await asyncio.sleep(10)
-                print(f"Received {handler.update_count} updates")
-                
-                # Print statistics
-                stats = client.get_stats()
-                print(f"Connection stats: {stats}")
-                
-            else:
-                print("❌ Initial connection failed")
-                return
+            # Wait for the initial data, for at most 10 seconds
+            try:
+                await asyncio.wait_for(handler.initial_data.wait(), timeout=10)
+            except asyncio.TimeoutError:
+                pass
+            print(f"Received {handler.update_count} updates")
             
-            # Test 2: Simulate disconnection by closing WebSocket
-            print("\nTest 2: Simulating disconnection")
-            print("-" * 30)
+            # Print statistics
+            stats = client.get_stats()
+            print(f"Connection stats: {stats}")
             
-            if client._websocket and not client._websocket.closed:
-                await client._websocket.close()
+        else:
+            print("❌ Initial connection failed")
+            return
+        
+        # Test 2: Simulate disconnection by closing WebSocket
+        print("\nTest 2: Simulating disconnection")
+        print(SUBSEPARATOR)
+        
+        if client._websocket and not client._websocket.closed:
+            await client._websocket.close()
+            if await client.wait_disconnected(timeout=5):
                 print("✅ WebSocket connection closed")
-                
-                # Wait for reconnection logic to kick in
-                print("Waiting for automatic reconnection...")
-                await asyncio.sleep(15)
-                
-                # Check if reconnected
-                if client.is_connected:
-                    print("✅ Automatic reconnection successful")
-                else:
-                    print("❌ Automatic reconnection failed")
-                
-                # Print updated statistics
-                stats = client.get_stats()
-                print(f"Reconnection stats: {stats}")
-            
-            # Test 3: Monitor for continued updates
-            print("\nTest 3: Monitoring continued updates")
-            print("-" * 30)
-            
-            initial_count = handler.update_count
-            await asyncio.sleep(20)
-            final_count = handler.update_count
+            else:
+                print("❌ Client did not notice the closed connection")
             
-            updates_received = final_count - initial_count
-            print(f"Received {updates_received} updates after reconnection")
+            # Wait for reconnection logic to kick in
+            print("Waiting for automatic reconnection...")
             
-            if updates_received > 0:
-                print("✅ Data updates resumed after reconnection")
+            # Check if reconnected
+            if await client.wait_connected(timeout=15):
+                print("✅ Automatic reconnection successful")
             else:
-                print("❌ No data updates after reconnection")
-            
-        except Exception as e:
-            print(f"Test error: {e}")
+                print("❌ Automatic reconnection failed")
             
-        finally:
-            # Clean shutdown
-            print("\nShutting down...")
-            await client.disconnect()
-            print("✅ Clean shutdown complete")
+            # Print updated statistics
+            stats = client.get_stats()
+            print(f"Reconnection stats: {stats}")
+        
+        # Test 3: Monitor for continued updates
+        print("\nTest 3: Monitoring continued updates")
+        print(SUBSEPARATOR)
+        
+        initial_count = handler.update_count
+        await asyncio.sleep(20)
+        final_count = handler.update_count
+        
+        updates_received = final_count - initial_count
+        print(f"Received {updates_received} updates after reconnection")
+        
+        if updates_received > 0:
+            print("✅ Data updates resumed after reconnection")
+        else:
+            print("❌ No data updates after reconnection")
+        
+    except Exception as e:
+        print(f"Test error: {e}")
+        
+    finally:
+        # Clean shutdown
+        print("\nShutting down...")
+        await client.disconnect()
+        print("✅ Clean shutdown complete")
 
 async def test_connection_resilience():
     """Test connection resilience with multiple disconnections."""
     
-    print("\n" + "=" * 60)
+    print("\n" + SEPARATOR)
     print("Testing Connection Resilience")
-    print("=" * 60)
+    print(SEPARATOR)
     
     handler = TestDataHandler()
     
-    async with aiohttp.ClientSession() as session:
-        client = SimpleWebSocketClient("192.168.105.15", session)
-        client.add_data_handler(handler.handle_data)
+    session = await get_session()
+    client = SimpleWebSocketClient("192.168.105.15", session)
+    client.add_data_handler(handler.handle_data)
+    
+    try:
+        # Connect initially
+        await client.connect()
         
-        try:
-            # Connect initially
-            await client.connect()
+        # Simulate multiple disconnections
+        for i in range(3):
+            print(f"\nDisconnection test {i+1}/3")
+            print(MINOR_SEPARATOR)
             
-            # Simulate multiple disconnections
-            for i in range(3):
-                print(f"\nDisconnection test {i+1}/3")
-                print("-" * 20)
-                
-                # Force disconnect
-                if client._websocket and not client._websocket.closed:
-                    await client._websocket.close()
+            # Force disconnect
+            if client._websocket and not client._websocket.closed:
+                await client._websocket.close()
+                if await client.wait_disconnected(timeout=5):
                     print("Connection closed")
-                
-                # Wait for reconnection
-                await asyncio.sleep(10)
-                
-                if client.is_connected:
-                    print("✅ Reconnected successfully")
                 else:
-                    print("❌ Reconnection failed")
-                
-                # Brief data collection period
-                initial_count = handler.update_count
-                await asyncio.sleep(5)
-                updates = handler.update_count - initial_count
-                print(f"Received {updates} updates")
-            
-            # Final statistics
-            stats = client.get_stats()
-            print(f"\nFinal statistics:")
-            print(f"  Total reconnects: {stats.get('total_reconnects', 0)}")
-            print(f"  Messages received: {stats.get('messages_received', 0)}")
-            print(f"  Currently connected: {stats.get('connected', False)}")
+                    print("❌ Client did not notice the closed connection")
             
-        except Exception as e:
-            print(f"Resilience test error: {e}")
+            # Wait for reconnection
+            if await client.wait_connected(timeout=10):
+                print("✅ Reconnected successfully")
+            else:
+                print("❌ Reconnection failed")
             
-        finally:
-            await client.disconnect()
+            # Brief data collection period
+            initial_count = handler.update_count
+            await asyncio.sleep(5)
+            updates = handler.update_count - initial_count
+            print(f"Received {updates} updates")
+        
+        # Final statistics
+        stats = client.get_stats()
+        print(f"\nFinal statistics:")
+        print(f"  Total reconnects: {stats.get('total_reconnects', 0)}")
+        print(f"  Messages received: {stats.get('messages_received', 0)}")
+        print(f"  Currently connected: {stats.get('connected', False)}")
+        
+    except Exception as e:
+        print(f"Resilience test error: {e}")
+        
+    finally:
+        await client.disconnect()
 
 async def main():
     """Run all reconnection tests."""
@@ -310,9 +376,9 @@ async def main():
         await test_websocket_reconnection()
         await test_connection_resilience()
         
-        print("\n" + "=" * 60)
+        print("\n" + SEPARATOR)
         print("RECONNECTION TEST CONCLUSIONS")
-        print("=" * 60)
+        print(SEPARATOR)
         print("\nIf reconnection works properly:")
         print("1. WebSocket should automatically reconnect after disconnection")
         print("2. Data updates should resume after reconnection")
@@ -326,6 +392,9 @@ async def main():
         print("\nTest interrupted by user")
     except Exception as e:
         print(f"Test failed with error: {e}")
+    finally:
+        if _SESSION is not None:
+            await _SESSION.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""Shared fixtures for CresControl tests."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from custom_components.crescontrol.websocket_client import CresControlWebSocketClient
+
+
+@pytest.fixture
+def mock_coordinator():
+    """Create a mock coordinator with no device data."""
+    coordinator = Mock()
+    coordinator.config_entry.entry_id = "test_entry"
+    coordinator.data = {}
+    coordinator.async_request_refresh = AsyncMock()
+    return coordinator
+
+
+@pytest.fixture
+def mock_client():
+    """Create a mock HTTP client whose writes succeed."""
+    client = Mock()
+    client.set_value = AsyncMock(return_value=True)
+    client.set_multiple_values = AsyncMock(return_value=True)
+    return client
+
+
+@pytest.fixture
+def websocket_client():
+    """Create a CresControlWebSocketClient on a mock session."""
+    return CresControlWebSocketClient("192.168.1.100", Mock())
+
+
+@pytest.fixture
+def mock_websocket(websocket_client):
+    """Attach an open mock WebSocket to the client."""
+    websocket = Mock(closed=False)
+    websocket.send_str = AsyncMock()
+    websocket.close = AsyncMock()
+    websocket_client._websocket = websocket
+    return websocket
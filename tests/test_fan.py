@@ -0,0 +1,85 @@
+"""Tests for the CresControl fan entity."""
+
+import pytest
+from homeassistant.components.fan import FanEntityFeature
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.crescontrol.fan import CresControlFan
+
+if not hasattr(FanEntityFeature, "TURN_ON"):
+    pytest.skip(
+        "fan entity needs FanEntityFeature.TURN_ON (Home Assistant 2024.8+)",
+        allow_module_level=True,
+    )
+
+
+@pytest.fixture
+def fan(mock_coordinator, mock_client):
+    """Create a fan entity on the shared mocks."""
+    return CresControlFan(mock_coordinator, mock_client, {})
+
+
+@pytest.mark.asyncio
+async def test_turn_on(fan, mock_client, mock_coordinator):
+    """Test that turning on enables the fan and sets the default speed."""
+    await fan.async_turn_on()
+
+    mock_client.set_multiple_values.assert_awaited_once_with(
+        {"fan:enabled": True, "fan:duty-cycle": 50}
+    )
+    mock_coordinator.async_request_refresh.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_set_percentage(fan, mock_client, mock_coordinator):
+    """Test that a speed is written together with enabling the fan."""
+    await fan.async_set_percentage(75)
+
+    mock_client.set_multiple_values.assert_awaited_once_with(
+        {"fan:enabled": True, "fan:duty-cycle": 75}
+    )
+    mock_coordinator.async_request_refresh.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["async_turn_off", "async_set_percentage"])
+async def test_turn_off(fan, mock_client, mock_coordinator, method):
+    """Test that turning off and a zero speed both disable the fan."""
+    args = (0,) if method == "async_set_percentage" else ()
+
+    await getattr(fan, method)(*args)
+
+    mock_client.set_value.assert_awaited_once_with("fan:enabled", False)
+    mock_coordinator.async_request_refresh.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("method", "args"),
+    [
+        ("async_turn_on", ()),
+        ("async_set_percentage", (75,)),
+        ("async_turn_off", ()),
+        ("async_set_percentage", (0,)),
+    ],
+)
+async def test_unconfirmed_write_raises(fan, mock_client, mock_coordinator, method, args):
+    """Test that a write the device did not confirm raises and skips the refresh."""
+    mock_client.set_value.return_value = False
+    mock_client.set_multiple_values.return_value = False
+
+    with pytest.raises(HomeAssistantError):
+        await getattr(fan, method)(*args)
+
+    mock_coordinator.async_request_refresh.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_client_error_raises(fan, mock_client, mock_coordinator):
+    """Test that a client exception is surfaced as a HomeAssistantError."""
+    mock_client.set_multiple_values.side_effect = OSError("reset")
+
+    with pytest.raises(HomeAssistantError):
+        await fan.async_turn_on(percentage=30)
+
+    mock_coordinator.async_request_refresh.assert_not_awaited()
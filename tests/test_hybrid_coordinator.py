@@ -0,0 +1,95 @@
+"""Tests for the CresControl hybrid coordinator data layers."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.crescontrol.hybrid_coordinator import (
+    CresControlHybridCoordinator,
+)
+from custom_components.crescontrol.websocket_client import CresControlWebSocketError
+
+
+@pytest.fixture
+def coordinator(mock_client):
+    """Create a coordinator whose WebSocket stays disconnected."""
+    mock_client.get_multiple_values = AsyncMock(return_value={})
+    websocket_client = Mock(is_connected=False)
+    websocket_client.connect = AsyncMock(return_value=False)
+    return CresControlHybridCoordinator(
+        Mock(), mock_client, websocket_client, "192.168.1.100", timedelta(seconds=30)
+    )
+
+
+def test_written_values_take_priority(coordinator):
+    """Test that a confirmed write overrides WebSocket and HTTP data."""
+    coordinator._http_data = {"out-a:voltage": "1.00", "in-a:voltage": "1.00"}
+    coordinator._websocket_data = {"out-a:voltage": "2.00"}
+
+    coordinator.async_apply_written_values({"out-a:voltage": 5.0})
+
+    assert coordinator.data == {"out-a:voltage": "5.0", "in-a:voltage": "1.00"}
+
+
+def test_websocket_report_replaces_written_value(coordinator):
+    """Test that a device report for a written parameter supersedes it."""
+    coordinator.async_apply_written_values({"out-a:voltage": 5.0, "out-b:voltage": 2.0})
+
+    coordinator._handle_websocket_data({"out-a:voltage": "4.90"})
+
+    assert coordinator.data == {"out-a:voltage": "4.90", "out-b:voltage": "2.0"}
+    assert coordinator._written_data == {"out-b:voltage": "2.0"}
+
+
+@pytest.mark.asyncio
+async def test_poll_replaces_only_returned_written_values(coordinator, mock_client):
+    """Test that a poll clears only the writes for parameters it returned."""
+    coordinator.async_apply_written_values({"out-a:voltage": 5.0, "out-b:voltage": 2.0})
+    mock_client.get_multiple_values.return_value = {"out-a:voltage": "4.90"}
+
+    data = await coordinator._async_update_data()
+
+    assert data == {"out-a:voltage": "4.90", "out-b:voltage": "2.0"}
+    assert coordinator._written_data == {"out-b:voltage": "2.0"}
+
+
+@pytest.mark.asyncio
+async def test_poll_started_before_write_keeps_it(coordinator, mock_client):
+    """Test that a poll begun before a write does not overwrite it."""
+
+    async def poll(parameters):
+        coordinator.async_apply_written_values({"out-a:voltage": 5.0})
+        return {"out-a:voltage": "0.00"}
+
+    mock_client.get_multiple_values.side_effect = poll
+
+    data = await coordinator._async_update_data()
+
+    assert data["out-a:voltage"] == "5.0"
+    assert coordinator._written_data == {"out-a:voltage": "5.0"}
+
+
+@pytest.mark.asyncio
+async def test_partial_poll_keeps_missed_values(coordinator, mock_client):
+    """Test that parameters a poll missed keep their last polled value."""
+    mock_client.get_multiple_values.return_value = {"in-a:voltage": "1.00", "fan:rpm": "1200"}
+    await coordinator._async_update_data()
+    mock_client.get_multiple_values.return_value = {"in-a:voltage": "1.10"}
+
+    data = await coordinator._async_update_data()
+
+    assert data == {"in-a:voltage": "1.10", "fan:rpm": "1200"}
+
+
+@pytest.mark.asyncio
+async def test_failed_poll_keeps_written_values(coordinator, mock_client):
+    """Test that a poll that received nothing fails without dropping writes."""
+    coordinator.async_apply_written_values({"out-a:voltage": 5.0})
+    mock_client.get_multiple_values.side_effect = CresControlWebSocketError("silent")
+
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+    assert coordinator._written_data == {"out-a:voltage": "5.0"}
@@ -0,0 +1,113 @@
+"""Tests for CresControl number entities."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from homeassistant.const import UnitOfElectricPotential
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.crescontrol.const import DOMAIN
+from custom_components.crescontrol.number import (
+    CORE_NUMBERS,
+    CresControlNumber,
+    async_setup_entry,
+)
+
+# Test ids for parametrizing over the number definitions
+NUMBER_IDS = [d["key"] for d in CORE_NUMBERS]
+
+
+@pytest.mark.parametrize("definition", CORE_NUMBERS, ids=NUMBER_IDS)
+def test_definition(mock_coordinator, mock_client, definition):
+    """Test that entities take their range and identity from the definition."""
+    entity = CresControlNumber(mock_coordinator, mock_client, {}, definition)
+
+    assert entity.unique_id == f"test_entry_{definition['key']}"
+    assert entity.native_min_value == definition["min_value"]
+    assert entity.native_max_value == definition["max_value"]
+    assert entity.native_step == definition["step"]
+    assert entity.native_unit_of_measurement == UnitOfElectricPotential.VOLT
+
+
+@pytest.mark.parametrize("definition", CORE_NUMBERS, ids=NUMBER_IDS)
+@pytest.mark.parametrize(
+    ("raw_value", "expected"),
+    [
+        ("5.25", 5.25),
+        (" 3.3 ", 3.3),
+        (7, 7.0),
+        ("", None),
+        ("N/A", None),
+        (None, None),
+    ],
+)
+def test_native_value(mock_coordinator, mock_client, definition, raw_value, expected):
+    """Test that device values are parsed as floats."""
+    mock_coordinator.data = {definition["key"]: raw_value}
+    entity = CresControlNumber(mock_coordinator, mock_client, {}, definition)
+
+    assert entity.native_value == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("definition", CORE_NUMBERS, ids=NUMBER_IDS)
+async def test_set_native_value(mock_coordinator, mock_client, definition):
+    """Test that writes reach the client and are published to the coordinator."""
+    entity = CresControlNumber(mock_coordinator, mock_client, {}, definition)
+    key = definition["key"]
+
+    await entity.async_set_native_value(4.5)
+
+    mock_client.set_value.assert_awaited_once_with(key, 4.5)
+    mock_coordinator.async_apply_written_values.assert_called_once_with({key: 4.5})
+    mock_coordinator.async_request_refresh.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_set_native_value_failure(mock_coordinator, mock_client):
+    """Test that an unconfirmed write raises and is not published."""
+    mock_client.set_value.return_value = False
+    entity = CresControlNumber(mock_coordinator, mock_client, {}, CORE_NUMBERS[0])
+
+    with pytest.raises(HomeAssistantError):
+        await entity.async_set_native_value(4.5)
+
+    mock_coordinator.async_apply_written_values.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_set_native_value_clamps(mock_coordinator, mock_client):
+    """Test that writes outside the range are clamped to its bounds."""
+    definition = CORE_NUMBERS[0]
+    entity = CresControlNumber(mock_coordinator, mock_client, {}, definition)
+    low, high = definition["min_value"], definition["max_value"]
+    inputs = [low - 5 + i * 0.1 for i in range(50)] + [high + i * 0.1 for i in range(50)]
+
+    await asyncio.gather(*(entity.async_set_native_value(v) for v in inputs))
+
+    written = [call.args[1] for call in mock_client.set_value.await_args_list]
+    assert written == [low] * 50 + [high] * 50
+
+
+@pytest.mark.asyncio
+async def test_async_setup_entry(mock_coordinator, mock_client):
+    """Test that setup adds one entity per number definition."""
+    hass = Mock()
+    hass.data = {
+        DOMAIN: {
+            "test_entry": {
+                "coordinator": mock_coordinator,
+                "http_client": mock_client,
+                "device_info": {},
+            }
+        }
+    }
+    entry = Mock(entry_id="test_entry")
+    async_add_entities = Mock()
+
+    await async_setup_entry(hass, entry, async_add_entities)
+
+    (added,) = async_add_entities.call_args.args
+    assert all(isinstance(e, CresControlNumber) for e in added)
+    assert {e.unique_id for e in added} == {f"test_entry_{key}" for key in NUMBER_IDS}
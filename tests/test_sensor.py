@@ -0,0 +1,83 @@
+"""Tests for CresControl sensor value parsing and validation."""
+
+import itertools
+
+import pytest
+
+from custom_components.crescontrol.sensor import CORE_SENSORS, CresControlSensor
+
+# Sensor keys read directly from coordinator data (RS485 sensors are parsed
+# from the shared rs485:response payload instead)
+SENSOR_KEYS = sorted(
+    {d["key"] for d in CORE_SENSORS if not d["key"].startswith("rs485:")}
+)
+
+# Values the device sends instead of a reading
+ERROR_VALUES = (
+    '{"error":"not connected"}',
+    '{ "error": "timeout" }',
+    "error",
+    "N/A",
+    "unavailable",
+    "unknown",
+    "",
+    "   ",
+)
+
+# Sensor definitions by key
+DEFINITIONS = {d["key"]: d for d in CORE_SENSORS}
+
+
+@pytest.mark.parametrize(
+    ("key", "raw_value"), list(itertools.product(SENSOR_KEYS, ERROR_VALUES))
+)
+def test_error_values(mock_coordinator, key, raw_value):
+    """Test that error responses never surface as sensor readings."""
+    mock_coordinator.data = {key: raw_value}
+    sensor = CresControlSensor(mock_coordinator, {}, DEFINITIONS[key])
+
+    expected = 0 if key == "fan:rpm" and raw_value.startswith("{") else None
+    assert sensor.native_value == expected
+
+
+@pytest.mark.parametrize(
+    ("key", "raw_value", "expected"),
+    [
+        ("in-a:voltage", "3.14159", 3.14),
+        ("in-b:voltage", "-15", -15.0),
+        ("in-a:voltage", "15.5", None),
+        ("fan:rpm", "1200", 1200),
+        ("fan:rpm", "10001", None),
+        ("extension:co2-2006:co2-concentration", "450", 450),
+        ("extension:co2-2006:co2-concentration", "12000", None),
+        ("extension:climate-2011:temperature", "23.456", 23.5),
+        ("extension:co2-2006:temperature", "-41", None),
+        ("extension:climate-2011:humidity", "57.72", 57.7),
+        ("extension:climate-2011:humidity", "101", None),
+        ("extension:climate-2011:vpd", "1.234", 1.23),
+        ("extension:climate-2011:vpd", "11", None),
+    ],
+)
+def test_value_validation(mock_coordinator, key, raw_value, expected):
+    """Test that readings are rounded and range-checked per sensor type."""
+    mock_coordinator.data = {key: raw_value}
+    sensor = CresControlSensor(mock_coordinator, {}, DEFINITIONS[key])
+
+    assert sensor.native_value == expected
+
+
+@pytest.mark.parametrize(
+    ("response", "expected"),
+    [
+        ("[5:100=25.93;101=57.72;102=.;103=812:133]", 812),
+        ("[5:100=25.93;101=57.72;102=.;103=20000:133]", None),
+        ("[5:100=25.93;101=57.72:133]", None),
+        ("garbage", None),
+    ],
+)
+def test_rs485_co2(mock_coordinator, response, expected):
+    """Test that the RS485 CO2 sensor extracts its parameter from the response."""
+    mock_coordinator.data = {"rs485:response": response}
+    sensor = CresControlSensor(mock_coordinator, {}, DEFINITIONS["rs485:response:103"])
+
+    assert sensor.native_value == expected
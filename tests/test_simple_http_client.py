@@ -0,0 +1,134 @@
+"""Tests for the CresControl HTTP client's WebSocket batch requests."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+from aiohttp import WSMsgType
+
+from custom_components.crescontrol import simple_http_client
+from custom_components.crescontrol.simple_http_client import SimpleCresControlHTTPClient
+from custom_components.crescontrol.websocket_client import CresControlWebSocketError
+
+
+def _replies(*messages):
+    """Return a receive() that yields messages, then stays silent."""
+    queue = list(messages)
+
+    async def receive():
+        if queue:
+            return Mock(type=WSMsgType.TEXT, data=queue.pop(0))
+        await asyncio.Event().wait()
+
+    return receive
+
+
+@pytest.fixture(autouse=True)
+def short_response_timeout(monkeypatch):
+    """Keep tests of unanswered requests fast."""
+    monkeypatch.setattr(simple_http_client, "RESPONSE_TIMEOUT_SECONDS", 0.01)
+
+
+@pytest.fixture
+def device_websocket():
+    """Create a mock device WebSocket that never answers by default."""
+    websocket = Mock()
+    websocket.send_str = AsyncMock()
+    websocket.receive = AsyncMock(side_effect=_replies())
+    return websocket
+
+
+@pytest.fixture
+def http_client(device_websocket):
+    """Create a client whose session connects to the mock device WebSocket."""
+    session = Mock()
+    session.ws_connect = MagicMock()
+    session.ws_connect.return_value.__aenter__.return_value = device_websocket
+    return SimpleCresControlHTTPClient("192.168.1.100", session)
+
+
+class TestSetMultipleValues:
+    """Test confirmation of batched writes."""
+
+    @pytest.mark.asyncio
+    async def test_all_confirmed(self, http_client, device_websocket):
+        """Test that writes are sent in order and confirmed by their replies."""
+        device_websocket.receive.side_effect = _replies(
+            "in-a:voltage::1.00", "fan:duty-cycle::40", "fan:enabled::1"
+        )
+
+        success = await http_client.set_multiple_values(
+            {"fan:enabled": True, "fan:duty-cycle": 40}
+        )
+
+        assert success is True
+        assert [c.args[0] for c in device_websocket.send_str.await_args_list] == [
+            "fan:enabled=1",
+            "fan:duty-cycle=40",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unrelated_pushes_do_not_confirm(self, http_client, device_websocket):
+        """Test that replies for other parameters are not counted."""
+        device_websocket.receive.side_effect = _replies(
+            "in-a:voltage::1.00", "fan:rpm::1200"
+        )
+
+        assert await http_client.set_multiple_values({"fan:enabled": True}) is False
+
+    @pytest.mark.asyncio
+    async def test_error_response_fails(self, http_client, device_websocket):
+        """Test that a device error reply fails the batch."""
+        device_websocket.receive.side_effect = _replies(
+            'fan:enabled::{"error":"read only"}'
+        )
+
+        assert await http_client.set_multiple_values({"fan:enabled": True}) is False
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self, http_client, device_websocket):
+        """Test that nothing is sent for an empty batch."""
+        assert await http_client.set_multiple_values({}) is True
+        device_websocket.send_str.assert_not_awaited()
+
+
+class TestGetMultipleValues:
+    """Test batched queries and their partial and failed outcomes."""
+
+    @pytest.mark.asyncio
+    async def test_full_batch(self, http_client, device_websocket):
+        """Test that every answered parameter is returned, ignoring others."""
+        device_websocket.receive.side_effect = _replies(
+            "fan:rpm:: 1200 ", "out-a:voltage::2.00", "in-a:voltage::1.00"
+        )
+
+        values = await http_client.get_multiple_values(["in-a:voltage", "fan:rpm"])
+
+        assert values == {"in-a:voltage": "1.00", "fan:rpm": "1200"}
+        assert sorted(c.args[0] for c in device_websocket.send_str.await_args_list) == [
+            "fan:rpm",
+            "in-a:voltage",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_partial_batch(self, http_client, device_websocket):
+        """Test that a silent parameter leaves the answered ones usable."""
+        device_websocket.receive.side_effect = _replies("in-a:voltage::1.00")
+
+        values = await http_client.get_multiple_values(["in-a:voltage", "fan:rpm"])
+
+        assert values == {"in-a:voltage": "1.00"}
+
+    @pytest.mark.asyncio
+    async def test_silent_device_raises(self, http_client):
+        """Test that a batch with no answers at all raises."""
+        with pytest.raises(CresControlWebSocketError):
+            await http_client.get_multiple_values(["in-a:voltage", "fan:rpm"])
+
+    @pytest.mark.asyncio
+    async def test_connection_failure_raises(self, http_client):
+        """Test that a failed connection raises instead of returning nothing."""
+        http_client.session.ws_connect.side_effect = OSError("unreachable")
+
+        with pytest.raises(CresControlWebSocketError):
+            await http_client.get_multiple_values(["in-a:voltage"])
@@ -0,0 +1,31 @@
+"""Tests for CresControl switch state parsing."""
+
+import pytest
+
+from custom_components.crescontrol.switch import CORE_SWITCHES, CresControlSwitch
+
+
+@pytest.mark.parametrize(
+    ("raw_value", "expected"),
+    [
+        ("1", True),
+        ("true", True),
+        (" ON ", True),
+        ("Enabled", True),
+        ("0", False),
+        ("false", False),
+        ("off", False),
+        ("DISABLED", False),
+        ("maybe", None),
+        ('{"error":"unknown"}', None),
+        (True, True),
+        (0, False),
+        (None, None),
+    ],
+)
+def test_is_on(mock_coordinator, mock_client, raw_value, expected):
+    """Test that device values map to the expected switch state."""
+    mock_coordinator.data = {CORE_SWITCHES[0]["key"]: raw_value}
+    switch = CresControlSwitch(mock_coordinator, mock_client, {}, CORE_SWITCHES[0])
+
+    assert switch.is_on is expected
@@ -0,0 +1,233 @@
+"""Tests for the CresControl WebSocket client message handling."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.crescontrol.websocket_client import is_error_response
+
+
+def _flush_now(client):
+    """Run the scheduled batch flush now instead of waiting out the window."""
+    handle = client._batch_flush_handle
+    assert handle is not None
+    handle.cancel()
+    client._flush_batch()
+
+
+class TestBatchDataHandlers:
+    """Test batched delivery of WebSocket data updates."""
+
+    @pytest.mark.asyncio
+    async def test_updates_are_coalesced(self, websocket_client):
+        """Test that messages within one window reach the handler as one dict."""
+        batches = []
+        websocket_client.add_batch_data_handler(batches.append)
+
+        await websocket_client._process_message("in-a:voltage::3.14")
+        await websocket_client._process_message("fan:rpm::1200")
+        await websocket_client._process_message("in-a:voltage::3.15")
+        assert batches == []
+
+        _flush_now(websocket_client)
+
+        assert batches == [{"in-a:voltage": "3.15", "fan:rpm": "1200"}]
+
+    @pytest.mark.asyncio
+    async def test_error_responses_are_not_batched(self, websocket_client):
+        """Test that device error responses never reach batch handlers."""
+        batches = []
+        websocket_client.add_batch_data_handler(batches.append)
+
+        await websocket_client._process_message('fan:rpm::{"error":"unknown"}')
+
+        assert websocket_client._batch_flush_handle is None
+        assert batches == []
+
+    @pytest.mark.asyncio
+    async def test_per_message_handlers_still_called(self, websocket_client):
+        """Test that regular data handlers keep receiving every message."""
+        updates = []
+        batches = []
+        websocket_client.add_data_handler(updates.append)
+        websocket_client.add_batch_data_handler(batches.append)
+
+        await websocket_client._process_message("in-a:voltage::3.14")
+        await websocket_client._process_message("in-b:voltage::1.00")
+        _flush_now(websocket_client)
+
+        assert updates == [{"in-a:voltage": "3.14"}, {"in-b:voltage": "1.00"}]
+        assert len(batches) == 1
+
+    @pytest.mark.asyncio
+    async def test_removed_handler_not_called(self, websocket_client):
+        """Test that a removed batch handler no longer receives updates."""
+        batches = []
+        websocket_client.add_batch_data_handler(batches.append)
+        websocket_client.remove_batch_data_handler(batches.append)
+
+        await websocket_client._process_message("in-a:voltage::3.14")
+
+        assert websocket_client._batch_flush_handle is None
+        assert batches == []
+
+    @pytest.mark.asyncio
+    async def test_handlers_get_separate_copies(self, websocket_client):
+        """Test that a handler mutating its batch does not affect another."""
+        seen = []
+
+        def mutate(batch):
+            batch.clear()
+
+        async def collect(batch):
+            seen.append(batch)
+
+        websocket_client.add_batch_data_handler(mutate)
+        websocket_client.add_batch_data_handler(collect)
+
+        await websocket_client._process_message("in-a:voltage::3.14")
+        _flush_now(websocket_client)
+        await asyncio.gather(*websocket_client._batch_tasks)
+
+        assert seen == [{"in-a:voltage": "3.14"}]
+        assert not websocket_client._batch_tasks
+
+    @pytest.mark.asyncio
+    async def test_async_handler_errors_are_logged(self, websocket_client, caplog):
+        """Test that an async batch handler failure is logged, not lost."""
+
+        async def fail(batch):
+            raise ValueError("boom")
+
+        websocket_client.add_batch_data_handler(fail)
+
+        await websocket_client._process_message("in-a:voltage::3.14")
+        _flush_now(websocket_client)
+        await asyncio.gather(*websocket_client._batch_tasks, return_exceptions=True)
+
+        assert "boom" in caplog.text
+        assert not websocket_client._batch_tasks
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_running_handlers(self, websocket_client):
+        """Test that disconnect cancels async batch handlers still running."""
+        started = asyncio.Event()
+
+        async def slow(batch):
+            started.set()
+            await asyncio.sleep(60)
+
+        websocket_client.add_batch_data_handler(slow)
+        await websocket_client._process_message("in-a:voltage::3.14")
+        _flush_now(websocket_client)
+        await started.wait()
+        (task,) = websocket_client._batch_tasks
+
+        await websocket_client.disconnect()
+
+        assert task.cancelled()
+        assert not websocket_client._batch_tasks
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ('{"error":"unknown parameter"}', True),
+        ('{ "error" : "timeout" }', True),
+        ('{"code":1,"error":"busy"}', True),
+        ('{"value":1}', False),
+        ('{"error"', False),
+        ("3.14", False),
+        ("", False),
+    ],
+)
+def test_is_error_response(value, expected):
+    """Test detection of device JSON error responses."""
+    assert is_error_response(value) is expected
+
+
+class TestSendCommands:
+    """Test pipelined sending of query commands."""
+
+    @pytest.mark.asyncio
+    async def test_limits_commands_awaiting_reply(self, websocket_client, mock_websocket):
+        """Test that a command is sent only once a reply frees a window slot."""
+        websocket_client._max_pending_replies = 2
+        task = asyncio.create_task(
+            websocket_client._send_commands(["in-a:voltage", "in-b:voltage", "fan:rpm"])
+        )
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert [c.args[0] for c in mock_websocket.send_str.await_args_list] == [
+            "in-a:voltage",
+            "in-b:voltage",
+        ]
+
+        await websocket_client._process_message('in-a:voltage::{"error":"unknown"}')
+        assert await task == 3
+        assert [c.args[0] for c in mock_websocket.send_str.await_args_list] == [
+            "in-a:voltage",
+            "in-b:voltage",
+            "fan:rpm",
+        ]
+        assert websocket_client._pending_replies == {}
+
+    @pytest.mark.asyncio
+    async def test_skips_failures_and_missing_replies(
+        self, websocket_client, mock_websocket
+    ):
+        """Test that failed sends and unanswered commands do not stop the rest."""
+        websocket_client._reply_timeout = 0.01
+        websocket_client._max_pending_replies = 1
+
+        async def send_str(command):
+            if command == "in-b:voltage":
+                raise OSError("reset")
+            if command == "fan:rpm":
+                await websocket_client._process_message(f"{command}::1200")
+
+        mock_websocket.send_str.side_effect = send_str
+
+        sent = await websocket_client._send_commands(
+            ["in-a:voltage", "in-b:voltage", "fan:rpm"]
+        )
+
+        assert sent == 2
+        assert [c.args[0] for c in mock_websocket.send_str.await_args_list] == [
+            "in-a:voltage",
+            "in-b:voltage",
+            "fan:rpm",
+        ]
+        assert websocket_client._pending_replies == {}
+
+    @pytest.mark.asyncio
+    async def test_disconnect_releases_waiting_sender(
+        self, websocket_client, mock_websocket
+    ):
+        """Test that disconnecting mid-batch ends the batch without cancelling it."""
+        websocket_client._max_pending_replies = 1
+        task = asyncio.create_task(
+            websocket_client._send_commands(["in-a:voltage", "fan:rpm"])
+        )
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        await websocket_client.disconnect()
+
+        assert await task == 1
+        assert websocket_client._pending_replies == {}
+
+
+@pytest.mark.asyncio
+async def test_connect_does_not_wait_for_replies(websocket_client, mock_websocket):
+    """Test that subscription requests are sent after connect() returns."""
+    websocket_client._websocket = None
+    websocket_client._session.ws_connect = AsyncMock(return_value=mock_websocket)
+    websocket_client._handle_messages = AsyncMock()
+
+    assert await websocket_client.connect() is True
+    mock_websocket.send_str.assert_not_awaited()
+    assert websocket_client._refresh_task is not None
+
+    await websocket_client.disconnect()
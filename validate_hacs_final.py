@@ -4,25 +4,30 @@ Final HACS compatibility validation for CresControl integration.
 """
 
 import json
-import os
 from pathlib import Path
 
+# Output section separators
+SEPARATOR = "=" * 40
+
+# Integration paths, relative to the repository root
+INTEGRATION_DIR = Path("custom_components/crescontrol")
+MANIFEST_PATH = INTEGRATION_DIR / "manifest.json"
+
 def validate_hacs_compatibility():
     """Validate HACS compatibility requirements."""
     
     print("HACS Compatibility Validation")
-    print("=" * 40)
+    print(SEPARATOR)
     
     issues = []
     
     # Check manifest.json
-    manifest_path = Path("custom_components/crescontrol/manifest.json")
-    if not manifest_path.exists():
+    if not MANIFEST_PATH.exists():
         issues.append("❌ manifest.json not found")
         return issues
     
     try:
-        with open(manifest_path) as f:
+        with open(MANIFEST_PATH) as f:
             manifest = json.load(f)
         
         # Required fields for HACS
@@ -67,26 +72,24 @@ def validate_hacs_compatibility():
         issues.append(f"❌ Invalid JSON in manifest.json: {e}")
     
     # Check required files
-    base_path = Path("custom_components/crescontrol")
     required_files = ["__init__.py", "config_flow.py"]
     
     for file in required_files:
-        if not (base_path / file).exists():
+        if not (INTEGRATION_DIR / file).exists():
             issues.append(f"❌ Missing required file: {file}")
     
     # Check for common HACS issues
-    if (base_path / "requirements.txt").exists():
+    if (INTEGRATION_DIR / "requirements.txt").exists():
         issues.append("⚠️  requirements.txt found - should use manifest.json requirements instead")
     
     # Check Python syntax
-    python_files = list(base_path.glob("*.py"))
+    python_files = list(INTEGRATION_DIR.glob("*.py"))
     syntax_errors = []
     
     for py_file in python_files:
         try:
-            with open(py_file, 'r', encoding='utf-8') as f:
-                source = f.read()
-            compile(source, str(py_file), 'exec')
+            # compile() decodes bytes itself, honouring any encoding declaration
+            compile(py_file.read_bytes(), str(py_file), 'exec')
         except SyntaxError as e:
             syntax_errors.append(f"{py_file.name}: {e}")
     
@@ -101,9 +104,9 @@ def main():
     """Run HACS validation."""
     issues = validate_hacs_compatibility()
     
-    print("\n" + "=" * 40)
+    print("\n" + SEPARATOR)
     print("VALIDATION RESULTS")
-    print("=" * 40)
+    print(SEPARATOR)
     
     if not issues:
         print("\n✅ All HACS compatibility checks passed!")
@@ -113,15 +116,14 @@ def main():
         for issue in issues:
             print(f"  {issue}")
     
-    print("\n" + "=" * 40)
+    print("\n" + SEPARATOR)
     print("HACS TROUBLESHOOTING")
-    print("=" * 40)
+    print(SEPARATOR)
     print("\nIf HACS shows version as commit hash (7246020):")
     print("1. Ensure the repository has proper Git tags")
     print("2. Check that the version in manifest.json matches a Git tag")
     print("3. HACS may need the repository to be properly tagged")
     print("4. Try reloading HACS or restarting Home Assistant")
-    
     return len(issues)
 
 if __name__ == "__main__":